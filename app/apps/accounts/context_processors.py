@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+from django.contrib.auth import get_user_model
+from django.db.models import Exists, OuterRef
+
 from apps.babies.models import Baby
 from apps.families.models import FamilyMembership
 
@@ -12,11 +15,26 @@ def nav_state(request):
             "nav_has_baby": False,
         }
 
-    family_ids = FamilyMembership.objects.filter(user=user).values_list("family_id", flat=True)
-    has_family = bool(family_ids)
-    has_baby = Baby.objects.filter(family_id__in=family_ids).exists() if has_family else False
+    # Templates may be rendered more than once per request; only probe the DB once.
+    cached = getattr(request, "_nav_state_cache", None)
+    if cached is not None:
+        return cached
+
+    # Both flags are correlated EXISTS subqueries, answered in one round trip.
+    flags = (
+        get_user_model()
+        .objects.filter(pk=user.pk)
+        .annotate(
+            has_family=Exists(FamilyMembership.objects.filter(user=OuterRef("pk"))),
+            has_baby=Exists(Baby.objects.filter(family__memberships__user=OuterRef("pk"))),
+        )
+        .values("has_family", "has_baby")
+        .first()
+    ) or {"has_family": False, "has_baby": False}
 
-    return {
-        "nav_has_family": has_family,
-        "nav_has_baby": has_baby,
+    state = {
+        "nav_has_family": flags["has_family"],
+        "nav_has_baby": flags["has_baby"],
     }
+    request._nav_state_cache = state
+    return state
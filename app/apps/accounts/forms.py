@@ -13,6 +13,13 @@ class UserRegistrationForm(UserCreationForm):
         fields = ("username", "email", "password1", "password2")
 
     def clean_email(self):
+        """
+        Normalize the email and reject addresses already in use.
+
+        The lookup stays case-insensitive because existing rows (e.g. created
+        through the admin) may not be lowercased; accounts migration 0001 adds
+        an UPPER(email) index so the iexact query is index-backed.
+        """
         email = self.cleaned_data["email"].strip().lower()
         if get_user_model().objects.filter(email__iexact=email).exists():
             raise forms.ValidationError("Unable to create account with provided information.")
@@ -0,0 +1,24 @@
+# Generated manually to back case-insensitive email lookups.
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction.
+    atomic = False
+
+    dependencies = [
+        ("auth", "0012_alter_user_first_name_max_length"),
+    ]
+
+    operations = [
+        # Django compiles email__iexact to UPPER("email"::text) = UPPER(%s) on
+        # PostgreSQL, so the expression index must match that form.
+        migrations.RunSQL(
+            sql=(
+                "CREATE INDEX CONCURRENTLY IF NOT EXISTS accounts_auth_user_email_upper_idx "
+                "ON auth_user (UPPER(email::text));"
+            ),
+            reverse_sql="DROP INDEX CONCURRENTLY IF EXISTS accounts_auth_user_email_upper_idx;",
+        ),
+    ]
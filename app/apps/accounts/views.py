@@ -1,15 +1,19 @@
 from __future__ import annotations
 
+from collections.abc import Iterator
+
 from django.contrib import messages
 from django.contrib.auth import login
 from django.contrib.auth import views as auth_views
 from django.contrib.auth.decorators import login_required
-from django.http import HttpRequest, HttpResponse, JsonResponse
+from django.http import HttpRequest, HttpResponse, JsonResponse, StreamingHttpResponse
 from django.shortcuts import redirect, render
 from django.views.decorators.http import require_GET, require_http_methods, require_POST
 
+from apps.common.http import json_dumps
 from apps.common.security import key_ip, rate_limit
-from apps.events.services import serialize_event
+from apps.events.models import Event
+from apps.events.services import EVENT_VALUES_FIELDS, serialize_event_values
 from apps.families.models import FamilyMembership
 
 from .forms import UserRegistrationForm
@@ -42,31 +46,42 @@ def register_view(request: HttpRequest) -> HttpResponse:
     return render(request, "accounts/register.html", {"form": form})
 
 
+EXPORT_CHUNK_SIZE = 2000
+
+
 @login_required
 @require_GET
-def account_export_view(request: HttpRequest) -> JsonResponse:
-    memberships = FamilyMembership.objects.select_related("family", "user").filter(user=request.user)
+def account_export_view(request: HttpRequest) -> StreamingHttpResponse:
+    memberships = list(FamilyMembership.objects.select_related("family").filter(user=request.user))
     family_ids = [membership.family_id for membership in memberships]
-    from apps.events.models import Event
-
-    events = Event.objects.filter(family_id__in=family_ids).select_related("baby", "family")
-    data = {
-        "user": {
-            "id": request.user.id,
-            "username": request.user.get_username(),
-            "email": request.user.email,
-        },
-        "families": [
-            {
-                "id": str(membership.family.id),
-                "name": membership.family.name,
-                "role": membership.role,
-            }
-            for membership in memberships
-        ],
-        "events": [serialize_event(event) for event in events],
+    # Plain value rows (detail columns LEFT JOINed in) skip model instantiation.
+    events = Event.objects.filter(family_id__in=family_ids).values(*EVENT_VALUES_FIELDS)
+    user = {
+        "id": request.user.id,
+        "username": request.user.get_username(),
+        "email": request.user.email,
     }
-    return JsonResponse(data)
+    families = [
+        {
+            "id": str(membership.family.id),
+            "name": membership.family.name,
+            "role": membership.role,
+        }
+        for membership in memberships
+    ]
+
+    def _stream() -> Iterator[bytes]:
+        # Emit the document piecewise so only one chunk of events is resident at a time.
+        yield b'{"user":' + json_dumps(user)
+        yield b',"families":' + json_dumps(families)
+        yield b',"events":['
+        separator = b""
+        for event in events.iterator(chunk_size=EXPORT_CHUNK_SIZE):
+            yield separator + json_dumps(serialize_event_values(event))
+            separator = b","
+        yield b"]}"
+
+    return StreamingHttpResponse(_stream(), content_type="application/json")
 
 
 @login_required
@@ -1,66 +1,86 @@
 from __future__ import annotations
 
-from datetime import timedelta
+import hashlib
 
 from django.contrib.auth.decorators import login_required
+from django.core.cache import cache
 from django.http import HttpRequest, HttpResponse, JsonResponse
 from django.shortcuts import render
-from django.utils import timezone
-from django.views.decorators.http import require_GET
+from django.views.decorators.http import etag, require_GET
 
 from apps.babies.models import Baby
-from apps.events.models import Event
-from apps.events.services import recent_counts_for_family
+from apps.common.http import json_dumps
+from apps.events.services import (
+    STATS_CACHE_TIMEOUT,
+    dashboard_counts,
+    stats_cache_is_shared,
+    stats_cache_version,
+)
 from apps.families.services import parse_uuid_or_none, user_families
 
 
+def _empty_stats() -> dict[str, int]:
+    return {
+        "feeding": 0,
+        "diaper": 0,
+        "sleep": 0,
+        "pumping": 0,
+        "last_24h": 0,
+        "last_7d": 0,
+        "last_30d": 0,
+    }
+
+
+def _compute_stats(active_family, active_baby) -> dict[str, int]:
+    return dashboard_counts(active_family.id, active_baby.id if active_baby else None)
+
+
 @login_required
 @require_GET
 def dashboard_view(request: HttpRequest):
-    families = user_families(request.user)
+    # One query for the user's families; the active one is picked from the list
+    # and the template gets the same list.
+    families = list(user_families(request.user))
     active_family_uuid = parse_uuid_or_none(request.session.get("active_family_id"))
 
     if active_family_uuid:
-        active_family = families.filter(id=active_family_uuid).first()
+        active_family = next(
+            (family for family in families if family.id == active_family_uuid), None
+        )
     else:
-        active_family = families.first()
+        active_family = families[0] if families else None
 
     if active_family:
         request.session["active_family_id"] = str(active_family.id)
     elif "active_family_id" in request.session:
         request.session.pop("active_family_id", None)
 
-    babies = Baby.objects.filter(family=active_family).order_by("name") if active_family else Baby.objects.none()
-    active_baby_uuid = parse_uuid_or_none(request.GET.get("baby"))
-    active_baby = babies.filter(id=active_baby_uuid).first() if active_baby_uuid else babies.first()
-
-    stats = {
-        "feeding": 0,
-        "diaper": 0,
-        "sleep": 0,
-        "pumping": 0,
-        "last_24h": 0,
-        "last_7d": 0,
-        "last_30d": 0,
-    }
-
+    # Fetch the family's babies once; the active baby is picked from the list
+    # and the template iterates the same list.
+    babies = []
     if active_family:
-        by_type = recent_counts_for_family(active_family.id, hours=24)
-        stats.update(by_type)
-        stats["last_24h"] = sum(by_type.values())
-
-    if active_baby:
-        now = timezone.now()
-        stats["last_7d"] = Event.objects.filter(
-            baby=active_baby,
-            occurred_at_utc__gte=now - timedelta(days=7),
-            occurred_at_utc__lte=now,
-        ).count()
-        stats["last_30d"] = Event.objects.filter(
-            baby=active_baby,
-            occurred_at_utc__gte=now - timedelta(days=30),
-            occurred_at_utc__lte=now,
-        ).count()
+        babies = list(
+            Baby.objects.filter(family=active_family)
+            .order_by("name")
+            .only("id", "name", "timezone")
+        )
+    active_baby_uuid = parse_uuid_or_none(request.GET.get("baby"))
+    if active_baby_uuid:
+        active_baby = next((baby for baby in babies if baby.id == active_baby_uuid), None)
+    else:
+        active_baby = babies[0] if babies else None
+
+    stats = _empty_stats()
+    if active_family and stats_cache_is_shared():
+        version = stats_cache_version(active_family.id)
+        baby_key = active_baby.id if active_baby else "none"
+        stats = cache.get_or_set(
+            f"stats:{active_family.id}:{baby_key}:{version}",
+            lambda: _compute_stats(active_family, active_baby),
+            STATS_CACHE_TIMEOUT,
+        )
+    elif active_family:
+        stats = _compute_stats(active_family, active_baby)
 
     return render(
         request,
@@ -80,35 +100,32 @@ def health_view(request: HttpRequest) -> JsonResponse:
     return JsonResponse({"status": "ok"})
 
 
-@require_GET
-def manifest_view(request: HttpRequest) -> JsonResponse:
-    data = {
-        "name": "BabyBuddy",
-        "short_name": "BabyBuddy",
-        "description": "Track diapers, feedings, sleep, and pumping.",
-        "start_url": "/",
-        "display": "standalone",
-        "background_color": "#f4f7fb",
-        "theme_color": "#0f172a",
-        "icons": [
-            {
-                "src": "/static/icons/icon-192.png",
-                "sizes": "192x192",
-                "type": "image/png",
-            },
-            {
-                "src": "/static/icons/icon-512.png",
-                "sizes": "512x512",
-                "type": "image/png",
-            },
-        ],
-    }
-    return JsonResponse(data)
-
+# PWA assets are constant, so encode them and compute their ETags once at import.
+_MANIFEST = {
+    "name": "BabyBuddy",
+    "short_name": "BabyBuddy",
+    "description": "Track diapers, feedings, sleep, and pumping.",
+    "start_url": "/",
+    "display": "standalone",
+    "background_color": "#f4f7fb",
+    "theme_color": "#0f172a",
+    "icons": [
+        {
+            "src": "/static/icons/icon-192.png",
+            "sizes": "192x192",
+            "type": "image/png",
+        },
+        {
+            "src": "/static/icons/icon-512.png",
+            "sizes": "512x512",
+            "type": "image/png",
+        },
+    ],
+}
+_MANIFEST_BODY = json_dumps(_MANIFEST)
+_MANIFEST_ETAG = hashlib.blake2b(_MANIFEST_BODY, digest_size=8).hexdigest()
 
-@require_GET
-def service_worker_view(request: HttpRequest) -> HttpResponse:
-    content = """
+_SERVICE_WORKER_BODY = """
 const CACHE_NAME = 'babybuddy-static-v2';
 const STATIC_URLS = [
   '/static/css/app.css',
@@ -150,7 +167,19 @@ self.addEventListener('fetch', (event) => {
     event.respondWith(fetch(event.request));
   }
 });
-""".strip()
-    response = HttpResponse(content, content_type="application/javascript")
+""".strip().encode("utf-8")
+_SERVICE_WORKER_ETAG = hashlib.blake2b(_SERVICE_WORKER_BODY, digest_size=8).hexdigest()
+
+
+@require_GET
+@etag(lambda request: _MANIFEST_ETAG)
+def manifest_view(request: HttpRequest) -> HttpResponse:
+    return HttpResponse(_MANIFEST_BODY, content_type="application/json")
+
+
+@require_GET
+@etag(lambda request: _SERVICE_WORKER_ETAG)
+def service_worker_view(request: HttpRequest) -> HttpResponse:
+    response = HttpResponse(_SERVICE_WORKER_BODY, content_type="application/javascript")
     response["Cache-Control"] = "no-cache"
     return response
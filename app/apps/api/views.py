@@ -1,25 +1,39 @@
 from __future__ import annotations
 
-import json
+import hashlib
 import logging
 from datetime import date
-from zoneinfo import ZoneInfo
 
+import orjson
 from django.contrib.auth.decorators import login_required
 from django.core.exceptions import PermissionDenied, ValidationError
-from django.http import HttpRequest, HttpResponse, JsonResponse
+from django.db import connections
+from django.http import HttpRequest, HttpResponse
+from django.utils.cache import get_conditional_response
+from django.utils.dateparse import parse_datetime
+from django.utils.http import quote_etag
+from django.views.decorators.cache import cache_control
 from django.views.decorators.http import require_http_methods
 
+from apps.common.http import OrjsonResponse, json_dumps
 from apps.common.security import key_user_or_ip, rate_limit
+from apps.common.timezones import is_valid_zone
 from apps.events.services import (
+    EVENT_VALUES_FIELDS,
+    SummaryWindow,
     create_event_for_baby,
+    daily_summaries_for_range,
     daily_summary,
     delete_event,
+    encode_event_cursor,
     event_queryset_for_user,
+    events_after_cursor,
     range_summary,
     require_baby_access,
     require_event_access,
     serialize_event,
+    serialize_event_values,
+    summary_state_token,
     update_event,
 )
 
@@ -29,26 +43,57 @@ logger = logging.getLogger(__name__)
 DEFAULT_PAGE_SIZE = 25
 MAX_PAGE_SIZE = 100
 
+# Longest range, in days, that range summaries will break down per day.
+MAX_BY_DAY_RANGE_DAYS = 366
 
-def _json_error(message: str, status: int = 400) -> JsonResponse:
-    return JsonResponse({"error": message}, status=status)
+
+def _json_error(message: str, status: int = 400) -> OrjsonResponse:
+    return OrjsonResponse({"error": message}, status=status)
+
+
+def _page_limit(request: HttpRequest, default_size: int = DEFAULT_PAGE_SIZE) -> int:
+    try:
+        limit = int(request.GET.get("limit", default_size))
+        return min(max(1, limit), MAX_PAGE_SIZE)  # Clamp between 1 and MAX_PAGE_SIZE
+    except (ValueError, TypeError):
+        return default_size
+
+
+def _estimated_count(queryset) -> int | None:
+    """
+    Planner row estimate for a queryset, or None when unavailable.
+
+    Uses EXPLAIN (FORMAT JSON) on PostgreSQL, which reads statistics instead
+    of scanning the matching rows.
+    """
+    connection = connections[queryset.db]
+    if connection.vendor != "postgresql":
+        return None
+    sql, params = queryset.order_by().query.sql_with_params()
+    with connection.cursor() as cursor:
+        cursor.execute(f"EXPLAIN (FORMAT JSON) {sql}", params)
+        plan = cursor.fetchone()[0]
+    if isinstance(plan, str):
+        plan = orjson.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
 
 
 def _paginate_queryset(request: HttpRequest, queryset, default_size: int = DEFAULT_PAGE_SIZE):
     """
-    Paginate a queryset with cursor-based pagination.
+    Paginate a queryset with offset-based pagination.
 
     Query params:
     - limit: Number of items per page (default 25, max 100)
     - offset: Number of items to skip (default 0)
+    - exact_count: "1" to force an exact COUNT(*) for ``total``
+
+    One extra row is fetched past the page. When that shows the page is the
+    last one, ``total`` is exact without a COUNT; otherwise it is the planner
+    estimate and ``total_is_estimate`` is true.
 
-    Returns tuple: (paginated_queryset, pagination_metadata)
+    Returns tuple: (page_rows, pagination_metadata)
     """
-    try:
-        limit = int(request.GET.get("limit", default_size))
-        limit = min(max(1, limit), MAX_PAGE_SIZE)  # Clamp between 1 and MAX_PAGE_SIZE
-    except (ValueError, TypeError):
-        limit = default_size
+    limit = _page_limit(request, default_size)
 
     try:
         offset = int(request.GET.get("offset", 0))
@@ -56,29 +101,84 @@ def _paginate_queryset(request: HttpRequest, queryset, default_size: int = DEFAU
     except (ValueError, TypeError):
         offset = 0
 
-    total_count = queryset.count()
-    paginated = queryset[offset : offset + limit]
+    rows = list(queryset[offset : offset + limit + 1])
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+
+    total_is_estimate = False
+    if request.GET.get("exact_count") == "1":
+        total = queryset.count()
+    elif not has_more and (rows or offset == 0):
+        total = offset + len(rows)
+    else:
+        estimate = _estimated_count(queryset)
+        if estimate is None:
+            total = queryset.count()
+        else:
+            # Never report fewer rows than the peek has already proven exist.
+            total = max(estimate, offset + len(rows) + int(has_more))
+            total_is_estimate = True
 
     metadata = {
-        "total": total_count,
+        "total": total,
+        "total_is_estimate": total_is_estimate,
         "limit": limit,
         "offset": offset,
-        "has_more": (offset + limit) < total_count,
+        "has_more": has_more,
     }
 
-    return paginated, metadata
+    return rows, metadata
+
+
+def _paginate_keyset(
+    request: HttpRequest,
+    queryset,
+    default_size: int = DEFAULT_PAGE_SIZE,
+):
+    """
+    Paginate an event ``.values()`` queryset with keyset (cursor) pagination.
+
+    Query params:
+    - limit: Number of items per page (default 25, max 100)
+    - cursor: Opaque token from a previous page's ``next_cursor``
+
+    Rows must include ``id`` and ``occurred_at_utc`` and are ordered by
+    (-occurred_at_utc, -id). One extra row is fetched to
+    detect whether another page exists, so no COUNT query is issued.
+
+    Returns tuple: (page_rows, pagination_metadata). Raises ValueError for a
+    malformed cursor.
+    """
+    limit = _page_limit(request, default_size)
+    queryset = events_after_cursor(queryset, request.GET.get("cursor"))
+
+    rows = list(queryset[: limit + 1])
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+
+    metadata = {
+        "limit": limit,
+        "has_more": has_more,
+        "next_cursor": (
+            encode_event_cursor(rows[-1]["occurred_at_utc"], rows[-1]["id"]) if has_more else None
+        ),
+    }
+
+    return rows, metadata
 
 
 def _load_json_body(request: HttpRequest) -> dict:
+    body = request.body
+    if not body:
+        return {}
     try:
-        return json.loads(request.body.decode("utf-8") or "{}")
-    except json.JSONDecodeError:
+        data = orjson.loads(body)
+    except orjson.JSONDecodeError:
         return {}
+    return data if isinstance(data, dict) else {}
 
 
 def _payload_from_json(body: dict) -> dict:
-    from django.utils.dateparse import parse_datetime
-
     occurred_raw = body.get("occurred_at_local") or body.get("occurred_at")
     occurred_at_local = parse_datetime(occurred_raw) if isinstance(occurred_raw, str) else None
     details = body.get("details") if isinstance(body.get("details"), dict) else {}
@@ -94,16 +194,11 @@ def _payload_from_json(body: dict) -> dict:
 def _safe_timezone_name_or_none(value: str | None) -> str | None:
     if not value:
         return None
-    try:
-        ZoneInfo(value)
-        return value
-    except Exception:
-        return None
+    return value if is_valid_zone(value) else None
 
 
 @login_required
-@rate_limit(limit=240, window_seconds=60, key_func=key_user_or_ip, methods={"GET"})
-@rate_limit(limit=60, window_seconds=60, key_func=key_user_or_ip, methods={"POST"})
+@rate_limit(limits={"GET": (240, 60), "POST": (60, 60)}, key_func=key_user_or_ip)
 @require_http_methods(["GET", "POST"])
 def baby_events_view(request: HttpRequest, baby_id):
     try:
@@ -120,8 +215,6 @@ def baby_events_view(request: HttpRequest, baby_id):
         if event_type:
             queryset = queryset.filter(event_type=event_type)
 
-        from django.utils.dateparse import parse_datetime
-
         if from_raw:
             parsed_from = parse_datetime(from_raw)
             if parsed_from:
@@ -131,15 +224,30 @@ def baby_events_view(request: HttpRequest, baby_id):
             if parsed_to:
                 queryset = queryset.filter(occurred_at_utc__lte=parsed_to)
 
-        # Apply pagination (default 25, max 100)
-        paginated_events, pagination = _paginate_queryset(request, queryset)
-
-        return JsonResponse(
-            {
-                "results": [serialize_event(event) for event in paginated_events],
-                "pagination": pagination,
-            }
+        # Value rows with the detail tables LEFT JOINed; no model instances are built.
+        queryset = queryset.values(*EVENT_VALUES_FIELDS)
+
+        # Keyset pagination by default; offset mode (with a total) only on request.
+        if not request.GET.get("cursor") and request.GET.get("count") == "1":
+            paginated_events, pagination = _paginate_queryset(request, queryset)
+        else:
+            try:
+                paginated_events, pagination = _paginate_keyset(request, queryset)
+            except ValueError:
+                return _json_error("Invalid cursor.")
+
+        # Encode each event straight to bytes and splice them into the envelope,
+        # skipping the intermediate list of dicts.
+        body = b"".join(
+            (
+                b'{"results":[',
+                b",".join(json_dumps(serialize_event_values(row)) for row in paginated_events),
+                b'],"pagination":',
+                json_dumps(pagination),
+                b"}",
+            )
         )
+        return HttpResponse(body, content_type="application/json")
 
     body = _load_json_body(request)
     payload = _payload_from_json(body)
@@ -163,7 +271,7 @@ def baby_events_view(request: HttpRequest, baby_id):
     except Exception:
         logger.exception("Unexpected error creating event")
         return _json_error("Unable to process request.", status=500)
-    return JsonResponse(serialize_event(event), status=201)
+    return OrjsonResponse(serialize_event(event), status=201)
 
 
 @login_required
@@ -197,13 +305,38 @@ def event_detail_view(request: HttpRequest, event_id):
     except Exception:
         logger.exception("Unexpected error updating event")
         return _json_error("Unable to process request.", status=500)
-    return JsonResponse(serialize_event(updated), status=200)
+    return OrjsonResponse(serialize_event(updated), status=200)
+
+
+def _summary_etag(request: HttpRequest, baby, start_day, end_day, timezone_name: str) -> str:
+    """
+    ETag for a baby's summary of the local days ``start_day`` to ``end_day``.
+
+    Changes when an event in that window is created, edited or deleted, with
+    the resolved timezone, and with the query string. Computed after the access
+    check and parameter validation, so a 304 never skips either.
+    """
+    raw = "|".join(
+        (
+            summary_state_token(baby, start_day, end_day, timezone_name),
+            timezone_name,
+            request.GET.urlencode(),
+        )
+    )
+    return quote_etag(hashlib.md5(raw.encode(), usedforsecurity=False).hexdigest())
 
 
 @login_required
 @rate_limit(limit=240, window_seconds=60, key_func=key_user_or_ip, methods={"GET"})
 @require_http_methods(["GET"])
+@cache_control(private=True, no_cache=True)
 def daily_summary_view(request: HttpRequest, baby_id):
+    """
+    Event counts for one local day.
+
+    Counts come from a single GROUP BY over event_type (see
+    summarize_baby_events); no Event rows are loaded into Python.
+    """
     try:
         baby = require_baby_access(request.user, baby_id)
     except PermissionDenied:
@@ -221,12 +354,20 @@ def daily_summary_view(request: HttpRequest, baby_id):
     except ValueError:
         return _json_error("date must be YYYY-MM-DD")
 
+    try:
+        etag = _summary_etag(request, baby, day, day, timezone_name)
+    except OverflowError:
+        return _json_error("date is out of range")
+    not_modified = get_conditional_response(request, etag=etag)
+    if not_modified is not None:
+        return not_modified
+
     try:
         summary = daily_summary(baby, day, timezone_name)
     except Exception:
         logger.exception("Unexpected error computing daily summary")
         return _json_error("Unable to process request.", status=500)
-    return JsonResponse(
+    response = OrjsonResponse(
         {
             "date": day.isoformat(),
             "timezone": timezone_name,
@@ -234,12 +375,22 @@ def daily_summary_view(request: HttpRequest, baby_id):
             "by_type": summary.by_type,
         }
     )
+    response["ETag"] = etag
+    return response
 
 
 @login_required
 @rate_limit(limit=240, window_seconds=60, key_func=key_user_or_ip, methods={"GET"})
 @require_http_methods(["GET"])
+@cache_control(private=True, no_cache=True)
 def range_summary_view(request: HttpRequest, baby_id):
+    """
+    Event counts for an inclusive range of local days.
+
+    Like daily_summary_view, this is one GROUP BY over event_type regardless
+    of how many events fall in the range. With ``by_day=1`` the response adds
+    per-day counts, still from a single query grouped by local day.
+    """
     try:
         baby = require_baby_access(request.user, baby_id)
     except PermissionDenied:
@@ -263,17 +414,47 @@ def range_summary_view(request: HttpRequest, baby_id):
     if end < start:
         return _json_error("to must be >= from")
 
+    by_day = request.GET.get("by_day") == "1"
+    if by_day and (end - start).days + 1 > MAX_BY_DAY_RANGE_DAYS:
+        return _json_error(f"by_day ranges are limited to {MAX_BY_DAY_RANGE_DAYS} days")
+
+    try:
+        etag = _summary_etag(request, baby, start, end, timezone_name)
+    except OverflowError:
+        return _json_error("from and to are out of range")
+    not_modified = get_conditional_response(request, etag=etag)
+    if not_modified is not None:
+        return not_modified
+
     try:
-        summary = range_summary(baby, start, end, timezone_name)
+        if by_day:
+            days = daily_summaries_for_range(baby, start, end, timezone_name)
+        else:
+            summary = range_summary(baby, start, end, timezone_name)
     except Exception:
         logger.exception("Unexpected error computing range summary")
         return _json_error("Unable to process request.", status=500)
-    return JsonResponse(
-        {
-            "from": start.isoformat(),
-            "to": end.isoformat(),
-            "timezone": timezone_name,
-            "total": summary.total,
-            "by_type": summary.by_type,
-        }
-    )
+
+    if by_day:
+        # Range totals are folded from the per-day rows; no second query.
+        by_type: dict[str, int] = {}
+        for window in days.values():
+            for event_type, count in window.by_type.items():
+                by_type[event_type] = by_type.get(event_type, 0) + count
+        summary = SummaryWindow(total=sum(by_type.values()), by_type=by_type)
+
+    data = {
+        "from": start.isoformat(),
+        "to": end.isoformat(),
+        "timezone": timezone_name,
+        "total": summary.total,
+        "by_type": summary.by_type,
+    }
+    if by_day:
+        data["by_day"] = [
+            {"date": day, "total": window.total, "by_type": window.by_type}
+            for day, window in days.items()
+        ]
+    response = OrjsonResponse(data)
+    response["ETag"] = etag
+    return response
@@ -0,0 +1,21 @@
+from __future__ import annotations
+
+from typing import Any
+
+import orjson
+from django.http import HttpResponse
+
+# orjson encodes datetime, date and UUID natively; naive datetimes are treated as UTC.
+ORJSON_OPTIONS = orjson.OPT_NAIVE_UTC
+
+
+def json_dumps(data: Any) -> bytes:
+    return orjson.dumps(data, option=ORJSON_OPTIONS)
+
+
+class OrjsonResponse(HttpResponse):
+    """Drop-in replacement for JsonResponse that serializes with orjson."""
+
+    def __init__(self, data: Any, **kwargs):
+        kwargs.setdefault("content_type", "application/json")
+        super().__init__(content=json_dumps(data), **kwargs)
@@ -0,0 +1,28 @@
+from __future__ import annotations
+
+import os
+import time
+import uuid
+
+_UNIX_MS_MASK = (1 << 48) - 1
+_RAND_MASK = (1 << 74) - 1
+
+
+def uuid7() -> uuid.UUID:
+    """
+    Time-ordered UUID (RFC 9562 version 7).
+
+    The leading 48 bits are the Unix time in milliseconds, so new keys land at
+    the right edge of a B-tree index instead of at random pages. The remaining
+    74 bits are random.
+    """
+    unix_ms = time.time_ns() // 1_000_000
+    rand = int.from_bytes(os.urandom(10)) & _RAND_MASK
+    value = (
+        (unix_ms & _UNIX_MS_MASK) << 80
+        | 0x7 << 76  # version
+        | (rand >> 62) << 64  # rand_a, 12 bits
+        | 0b10 << 62  # RFC 4122 variant
+        | (rand & ((1 << 62) - 1))  # rand_b, 62 bits
+    )
+    return uuid.UUID(int=value)
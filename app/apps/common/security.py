@@ -1,15 +1,35 @@
 from __future__ import annotations
 
+import base64
 import hashlib
 import ipaddress
 import os
 import time
 from collections.abc import Callable
-from functools import wraps
+from functools import lru_cache, wraps
 
 from django.core.cache import cache
 from django.http import HttpRequest, HttpResponse, JsonResponse
 
+_time = time.time
+
+# Read once at import; the proxy topology does not change while a worker runs.
+_TRUST_X_FORWARDED_FOR = os.getenv("TRUST_X_FORWARDED_FOR", "false").lower() in {
+    "1",
+    "true",
+    "yes",
+    "on",
+}
+
+
+@lru_cache(maxsize=1024)
+def _is_valid_ip(value: str) -> bool:
+    try:
+        ipaddress.ip_address(value)
+    except ValueError:
+        return False
+    return True
+
 
 def get_client_ip(request: HttpRequest) -> str:
     """
@@ -21,33 +41,22 @@ def get_client_ip(request: HttpRequest) -> str:
     2. Sets X-Forwarded-For to the actual client IP
 
     If TRUST_X_FORWARDED_FOR is enabled, validates the IP address format
-    to prevent header injection attacks.
+    to prevent header injection attacks. The setting is read once at import.
 
     Returns:
         str: Client IP address or "unknown" if not available
     """
-    trust_forwarded = os.getenv("TRUST_X_FORWARDED_FOR", "false").lower() in {
-        "1",
-        "true",
-        "yes",
-        "on",
-    }
-
-    if trust_forwarded:
+    if _TRUST_X_FORWARDED_FOR:
         forwarded = request.META.get("HTTP_X_FORWARDED_FOR", "").strip()
         if forwarded:
             # X-Forwarded-For format: "client, proxy1, proxy2"
             # Take the leftmost (client) IP
-            client_ip = forwarded.split(",")[0].strip()
+            client_ip = forwarded.partition(",")[0].strip()
 
-            # Validate IP address format to prevent injection
-            try:
-                ipaddress.ip_address(client_ip)
+            # Validate IP address format to prevent injection; invalid values
+            # fall back to REMOTE_ADDR
+            if _is_valid_ip(client_ip):
                 return client_ip
-            except ValueError:
-                # Invalid IP format - fall back to REMOTE_ADDR
-                # Log this for security monitoring
-                pass
 
     # Use direct connection IP (most secure, works without reverse proxy)
     return request.META.get("REMOTE_ADDR", "unknown")
@@ -79,45 +88,95 @@ def default_rate_limit_response(request: HttpRequest, retry_after: int) -> HttpR
 
 def rate_limit(
     *,
-    limit: int,
-    window_seconds: int,
+    limit: int | None = None,
+    window_seconds: int | None = None,
     key_func: Callable[[HttpRequest], str] = key_ip,
     methods: set[str] | None = None,
+    limits: dict[str, tuple[int, int]] | None = None,
     response_factory: Callable[[HttpRequest, int], HttpResponse] = default_rate_limit_response,
 ):
-    methods_upper = {method.upper() for method in methods} if methods else None
+    """
+    Fixed-window rate limit keyed by view, ``key_func(request)`` and time bucket.
+
+    Either pass ``limit``/``window_seconds`` (optionally restricted to
+    ``methods``, which then share one counter), or ``limits`` mapping each
+    method to its own ``(limit, window_seconds)`` and counter, e.g.
+    ``limits={"GET": (240, 60), "POST": (60, 60)}``.
+    """
+    # Each rule is (limit, window_seconds, counter scope).
+    if limits is not None:
+        rules = {
+            method.upper(): (method_limit, window, f"{method.upper()}:{window}")
+            for method, (method_limit, window) in limits.items()
+        }
+    elif limit is None or window_seconds is None:
+        raise TypeError("rate_limit() requires limit and window_seconds, or limits")
+    elif methods:
+        rules = {method.upper(): (limit, window_seconds, str(window_seconds)) for method in methods}
+    else:
+        rules = None
 
     def decorator(view):
-        @wraps(view)
-        def wrapped(request: HttpRequest, *args, **kwargs):
-            if methods_upper and request.method.upper() not in methods_upper:
-                return view(request, *args, **kwargs)
+        # The view identity and windows are fixed per decoration, so hash them once.
+        view_name = f"{view.__module__}.{view.__name__}"
+
+        def key_prefix(scope: str):
+            # Seed a hasher with the static part; each check extends a copy of it.
+            return hashlib.blake2b(f"{view_name}:{scope}".encode(), digest_size=16)
 
-            now = int(time.time())
+        def check(
+            request: HttpRequest, limit: int, window_seconds: int, prefix
+        ) -> HttpResponse | None:
+            now = int(_time())
             bucket = now // window_seconds
-            retry_after = window_seconds - (now % window_seconds)
-
-            # Build unique cache key for this view, user/IP, and time bucket
-            view_name = f"{view.__module__}.{view.__name__}"
-            key_identifier = key_func(request)
-            key_source = f"{view_name}:{key_identifier}:{bucket}:{window_seconds}"
-            key_hash = hashlib.sha256(key_source.encode("utf-8")).hexdigest()
-            cache_key = f"rate-limit:{key_hash}"
-
-            count = cache.get(cache_key)
-            if count is None:
-                cache.set(cache_key, 1, timeout=window_seconds + 1)
-                count = 1
-            else:
-                try:
-                    count = cache.incr(cache_key)
-                except ValueError:
-                    cache.set(cache_key, 1, timeout=window_seconds + 1)
-                    count = 1
-
-            if int(count) > limit:
-                return response_factory(request, retry_after)
-            return view(request, *args, **kwargs)
+
+            # Build unique cache key for this view, user/IP, and time bucket:
+            # "rl:" + base32 of a 128-bit BLAKE2b digest, 29 bytes in total.
+            digest = prefix.copy()
+            digest.update(f":{key_func(request)}:{bucket}".encode())
+            cache_key = "rl:" + base64.b32encode(digest.digest()).rstrip(b"=").decode()
+            timeout = window_seconds + 1
+
+            # add() only succeeds for the first hit in a window, so concurrent
+            # first requests cannot both start the counter at 1.
+            if cache.add(cache_key, 1, timeout=timeout):
+                return None
+            try:
+                count = cache.incr(cache_key)
+            except ValueError:
+                # The key expired between add() and incr(); start a new window.
+                cache.add(cache_key, 1, timeout=timeout)
+                return None
+
+            if count > limit:
+                return response_factory(request, window_seconds - (now % window_seconds))
+            return None
+
+        # Specialize the wrapper so unfiltered views skip the method lookup entirely.
+        if rules is None:
+            prefix = key_prefix(str(window_seconds))
+
+            @wraps(view)
+            def wrapped(request: HttpRequest, *args, **kwargs):
+                limited = check(request, limit, window_seconds, prefix)
+                if limited is not None:
+                    return limited
+                return view(request, *args, **kwargs)
+
+        else:
+            compiled = {
+                method: (method_limit, window, key_prefix(scope))
+                for method, (method_limit, window, scope) in rules.items()
+            }
+
+            @wraps(view)
+            def wrapped(request: HttpRequest, *args, **kwargs):
+                rule = compiled.get(request.method)
+                if rule is not None:
+                    limited = check(request, *rule)
+                    if limited is not None:
+                        return limited
+                return view(request, *args, **kwargs)
 
         return wrapped
 
@@ -0,0 +1,23 @@
+from __future__ import annotations
+
+from functools import lru_cache
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+# What ZoneInfo raises for a name it cannot load: unknown keys, malformed or
+# path-like keys, directories in the tz database and non-string values.
+INVALID_ZONE_ERRORS = (ZoneInfoNotFoundError, ValueError, TypeError, OSError)
+
+
+@lru_cache(maxsize=512)
+def get_zone(name: str) -> ZoneInfo:
+    """ZoneInfo for ``name``, memoized for the life of the process."""
+    return ZoneInfo(name)
+
+
+@lru_cache(maxsize=1024)
+def is_valid_zone(name: str) -> bool:
+    try:
+        get_zone(name)
+    except INVALID_ZONE_ERRORS:
+        return False
+    return True
@@ -1,36 +1,66 @@
 from django.contrib import admin
+from django.contrib.admin.views.main import ChangeList
 
 from .models import DiaperEvent, Event, FeedingEvent, IdempotencyRecord, PumpingEvent, SleepEvent
+from .services import event_detail_copy_fields, sync_event_detail_copies
+
+
+class EventChangeList(ChangeList):
+    def get_queryset(self, request, *args, **kwargs):
+        return super().get_queryset(request, *args, **kwargs).for_list()
 
 
 @admin.register(Event)
 class EventAdmin(admin.ModelAdmin):
     list_display = ("event_type", "baby", "family", "occurred_at_utc", "created_by")
+    list_select_related = ("baby", "family", "created_by")
     list_filter = ("event_type", "timezone")
     search_fields = ("baby__name", "family__name", "notes")
 
+    def get_changelist(self, request, **kwargs):
+        # Only the changelist is narrowed; the change form still loads every field.
+        return EventChangeList
+
+    def save_model(self, request, obj, form, change):
+        super().save_model(request, obj, form, change)
+        if change:
+            sync_event_detail_copies(obj)
+
+
+class EventDetailAdmin(admin.ModelAdmin):
+    # The copied event columns are filled from the parent event on save.
+    exclude = ("family", "baby", "occurred_at_utc")
+    # Event.__str__ reads the baby name.
+    list_select_related = ("event__baby",)
+
+    def save_model(self, request, obj, form, change):
+        for field, value in event_detail_copy_fields(obj.event).items():
+            setattr(obj, field, value)
+        super().save_model(request, obj, form, change)
+
 
 @admin.register(FeedingEvent)
-class FeedingEventAdmin(admin.ModelAdmin):
+class FeedingEventAdmin(EventDetailAdmin):
     list_display = ("event", "method", "amount_ml", "side", "duration_min")
 
 
 @admin.register(DiaperEvent)
-class DiaperEventAdmin(admin.ModelAdmin):
+class DiaperEventAdmin(EventDetailAdmin):
     list_display = ("event", "diaper_type", "color", "consistency")
 
 
 @admin.register(SleepEvent)
-class SleepEventAdmin(admin.ModelAdmin):
+class SleepEventAdmin(EventDetailAdmin):
     list_display = ("event", "start_at_utc", "end_at_utc", "quality")
 
 
 @admin.register(PumpingEvent)
-class PumpingEventAdmin(admin.ModelAdmin):
+class PumpingEventAdmin(EventDetailAdmin):
     list_display = ("event", "amount_ml", "duration_min", "side")
 
 
 @admin.register(IdempotencyRecord)
 class IdempotencyRecordAdmin(admin.ModelAdmin):
     list_display = ("user", "key", "family", "baby", "event", "created_at")
+    list_select_related = ("user", "family", "baby", "event__baby")
     search_fields = ("user__username", "key")
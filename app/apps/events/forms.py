@@ -1,15 +1,149 @@
 from __future__ import annotations
 
 from django import forms
+from django.core.exceptions import ValidationError
 from django.utils import timezone
 
-from .models import DiaperEvent, Event, FeedingEvent, PumpingEvent, SleepEvent
+from apps.common.timezones import get_zone
+
+from .models import (
+    EVENT_TYPE_CODE,
+    DiaperEvent,
+    Event,
+    FeedingEvent,
+    PumpingEvent,
+    SleepEvent,
+)
 
 DATETIME_INPUT_FORMAT = "%Y-%m-%dT%H:%M"
 
 
+def _format_input_datetime(value) -> str:
+    """Format like ``value.strftime(DATETIME_INPUT_FORMAT)`` without strftime."""
+    return f"{value.year:04d}-{value.month:02d}-{value.day:02d}T{value.hour:02d}:{value.minute:02d}"
+
+
+class FastChoiceField(forms.ChoiceField):
+    """ChoiceField for flat choices that validates with one frozenset lookup."""
+
+    def __init__(self, *, choices, **kwargs):
+        super().__init__(choices=choices, **kwargs)
+        self.choice_values = frozenset(str(value) for value, _ in choices)
+
+    def valid_value(self, value) -> bool:
+        return str(value) in self.choice_values
+
+
+# Detail builders read cleaned data from a valid form or bulk_clean(): every field
+# is present, and empty text and choice fields are already "".
+def _feeding_details(cleaned: dict) -> dict:
+    return {
+        "method": cleaned["feeding_method"],
+        "amount_ml": cleaned["feeding_amount_ml"],
+        "side": cleaned["feeding_side"],
+        "duration_min": cleaned["feeding_duration_min"],
+    }
+
+
+def _diaper_details(cleaned: dict) -> dict:
+    return {
+        "diaper_type": cleaned["diaper_type"],
+        "color": cleaned["diaper_color"],
+        "consistency": cleaned["diaper_consistency"],
+    }
+
+
+def _sleep_details(cleaned: dict) -> dict:
+    return {
+        "sleep_end_local": cleaned["sleep_end_local"],
+        "quality": cleaned["sleep_quality"] or SleepEvent.Quality.UNKNOWN,
+    }
+
+
+def _pumping_details(cleaned: dict) -> dict:
+    return {
+        "amount_ml": cleaned["pumping_amount_ml"],
+        "duration_min": cleaned["pumping_duration_min"],
+        "side": cleaned["pumping_side"],
+    }
+
+
+_FEEDING = EVENT_TYPE_CODE[Event.EventType.FEEDING]
+_DIAPER = EVENT_TYPE_CODE[Event.EventType.DIAPER]
+_SLEEP = EVENT_TYPE_CODE[Event.EventType.SLEEP]
+_PUMPING = EVENT_TYPE_CODE[Event.EventType.PUMPING]
+
+# Builds the service-layer ``details`` payload from cleaned form data, indexed by
+# EVENT_TYPE_CODE.
+_DETAIL_BUILDERS = [None] * len(EVENT_TYPE_CODE)
+_DETAIL_BUILDERS[_FEEDING] = _feeding_details
+_DETAIL_BUILDERS[_DIAPER] = _diaper_details
+_DETAIL_BUILDERS[_SLEEP] = _sleep_details
+_DETAIL_BUILDERS[_PUMPING] = _pumping_details
+
+
+def _diaper_errors(cleaned: dict):
+    if not cleaned.get("diaper_type"):
+        yield "diaper_type", "Diaper type is required for diaper events."
+
+
+def _sleep_errors(cleaned: dict):
+    occurred = cleaned.get("occurred_at_local")
+    sleep_end = cleaned.get("sleep_end_local")
+    if occurred and sleep_end and sleep_end < occurred:
+        yield "sleep_end_local", "Sleep end time must be after start time."
+
+
+def _pumping_errors(cleaned: dict):
+    if not cleaned.get("pumping_amount_ml") and not cleaned.get("pumping_duration_min"):
+        yield "pumping_amount_ml", "Provide amount or duration for pumping events."
+
+
+# Per-type cross-field rules shared by clean() and bulk_clean(), keyed by EVENT_TYPE_CODE.
+_CROSS_FIELD_RULES = {
+    _DIAPER: _diaper_errors,
+    _SLEEP: _sleep_errors,
+    _PUMPING: _pumping_errors,
+}
+
+
+def _cross_field_errors(code: int | None, cleaned: dict):
+    """Yield (field, message) for the rules of event type ``code``; nothing for None."""
+    rule = _CROSS_FIELD_RULES.get(code)
+    return rule(cleaned) if rule is not None else ()
+
+
+def _build_payload(cleaned: dict) -> dict:
+    event_type = cleaned["event_type"]
+    return {
+        "event_type": event_type,
+        "occurred_at_local": cleaned["occurred_at_local"],
+        "timezone": cleaned["timezone"],
+        "notes": cleaned["notes"],
+        "details": _DETAIL_BUILDERS[EVENT_TYPE_CODE[event_type]](cleaned),
+    }
+
+
+def _bulk_clean_one(fields: dict, data: dict) -> tuple[dict, dict[str, list[str]]]:
+    """Clean ``data`` with the form's own ``fields`` and apply the cross-field rules."""
+    cleaned: dict[str, object] = {}
+    errors: dict[str, list[str]] = {}
+    for name, field in fields.items():
+        try:
+            cleaned[name] = field.clean(data.get(name))
+        except ValidationError as exc:
+            errors[name] = exc.messages
+
+    # An invalid event_type has no cleaned value, so no per-type rule applies.
+    code = EVENT_TYPE_CODE.get(cleaned.get("event_type"))
+    for name, message in _cross_field_errors(code, cleaned):
+        errors.setdefault(name, []).append(message)
+
+    return cleaned, errors
+
+
 class EventForm(forms.Form):
-    event_type = forms.ChoiceField(choices=Event.EventType.choices)
+    event_type = FastChoiceField(choices=Event.EventType.choices)
     occurred_at_local = forms.DateTimeField(
         input_formats=[DATETIME_INPUT_FORMAT],
         widget=forms.DateTimeInput(format=DATETIME_INPUT_FORMAT, attrs={"type": "datetime-local"}),
@@ -17,12 +151,12 @@ class EventForm(forms.Form):
     timezone = forms.CharField(max_length=64, initial="UTC")
     notes = forms.CharField(required=False, widget=forms.Textarea(attrs={"rows": 3}))
 
-    feeding_method = forms.ChoiceField(choices=FeedingEvent.Method.choices, required=False)
+    feeding_method = FastChoiceField(choices=FeedingEvent.Method.choices, required=False)
     feeding_amount_ml = forms.IntegerField(min_value=0, required=False)
-    feeding_side = forms.ChoiceField(choices=FeedingEvent.Side.choices, required=False)
+    feeding_side = FastChoiceField(choices=FeedingEvent.Side.choices, required=False)
     feeding_duration_min = forms.IntegerField(min_value=0, required=False)
 
-    diaper_type = forms.ChoiceField(choices=DiaperEvent.DiaperType.choices, required=False)
+    diaper_type = FastChoiceField(choices=DiaperEvent.DiaperType.choices, required=False)
     diaper_color = forms.CharField(max_length=64, required=False)
     diaper_consistency = forms.CharField(max_length=64, required=False)
 
@@ -31,95 +165,72 @@ class EventForm(forms.Form):
         input_formats=[DATETIME_INPUT_FORMAT],
         widget=forms.DateTimeInput(format=DATETIME_INPUT_FORMAT, attrs={"type": "datetime-local"}),
     )
-    sleep_quality = forms.ChoiceField(choices=SleepEvent.Quality.choices, required=False)
+    sleep_quality = FastChoiceField(choices=SleepEvent.Quality.choices, required=False)
 
     pumping_amount_ml = forms.IntegerField(min_value=0, required=False)
     pumping_duration_min = forms.IntegerField(min_value=0, required=False)
-    pumping_side = forms.ChoiceField(choices=PumpingEvent.Side.choices, required=False)
+    pumping_side = FastChoiceField(choices=PumpingEvent.Side.choices, required=False)
 
     def clean(self):
         cleaned = super().clean()
-        event_type = cleaned.get("event_type")
-
-        if event_type == Event.EventType.DIAPER and not cleaned.get("diaper_type"):
-            self.add_error("diaper_type", "Diaper type is required for diaper events.")
-
-        if event_type == Event.EventType.SLEEP:
-            occurred = cleaned.get("occurred_at_local")
-            sleep_end = cleaned.get("sleep_end_local")
-            if occurred and sleep_end and sleep_end < occurred:
-                self.add_error("sleep_end_local", "Sleep end time must be after start time.")
-
-        if event_type == Event.EventType.PUMPING:
-            if not cleaned.get("pumping_amount_ml") and not cleaned.get("pumping_duration_min"):
-                self.add_error(
-                    "pumping_amount_ml",
-                    "Provide amount or duration for pumping events.",
-                )
-
+        code = EVENT_TYPE_CODE.get(cleaned.get("event_type"))
+        if code is None:
+            # event_type already failed validation; no per-type rule can apply.
+            return cleaned
+        for field, message in _cross_field_errors(code, cleaned):
+            self.add_error(field, message)
         return cleaned
 
     def to_payload(self) -> dict:
-        cleaned = self.cleaned_data
-        event_type = cleaned["event_type"]
-
-        details: dict[str, object] = {}
-        if event_type == Event.EventType.FEEDING:
-            details = {
-                "method": cleaned.get("feeding_method") or "",
-                "amount_ml": cleaned.get("feeding_amount_ml"),
-                "side": cleaned.get("feeding_side") or "",
-                "duration_min": cleaned.get("feeding_duration_min"),
-            }
-        elif event_type == Event.EventType.DIAPER:
-            details = {
-                "diaper_type": cleaned.get("diaper_type"),
-                "color": cleaned.get("diaper_color") or "",
-                "consistency": cleaned.get("diaper_consistency") or "",
-            }
-        elif event_type == Event.EventType.SLEEP:
-            details = {
-                "sleep_end_local": cleaned.get("sleep_end_local"),
-                "quality": cleaned.get("sleep_quality") or SleepEvent.Quality.UNKNOWN,
-            }
-        elif event_type == Event.EventType.PUMPING:
-            details = {
-                "amount_ml": cleaned.get("pumping_amount_ml"),
-                "duration_min": cleaned.get("pumping_duration_min"),
-                "side": cleaned.get("pumping_side") or "",
-            }
+        return _build_payload(self.cleaned_data)
 
-        return {
-            "event_type": event_type,
-            "occurred_at_local": cleaned["occurred_at_local"],
-            "timezone": cleaned["timezone"],
-            "notes": cleaned.get("notes") or "",
-            "details": details,
-        }
+    @classmethod
+    def bulk_clean(cls, payloads: list[dict]) -> tuple[list[dict], list[tuple[int, dict]]]:
+        """
+        Validate many submissions without binding a form per item.
+
+        Each item uses the form's field names and rules. Returns
+        ``(valid, errors)``: ``valid`` holds to_payload()-shaped dicts for the
+        items that passed, ``errors`` holds ``(index, {field: [messages]})``
+        for the rest. Use the form itself for the HTML views.
+        """
+        valid: list[dict] = []
+        errors: list[tuple[int, dict]] = []
+        for index, data in enumerate(payloads):
+            cleaned, item_errors = _bulk_clean_one(cls.base_fields, data)
+            if item_errors:
+                errors.append((index, item_errors))
+            else:
+                valid.append(_build_payload(cleaned))
+        return valid, errors
 
     @classmethod
     def initial_for_new(cls, timezone_name: str = "UTC") -> dict:
         now = timezone.localtime()
         return {
-            "occurred_at_local": now.strftime(DATETIME_INPUT_FORMAT),
+            "occurred_at_local": _format_input_datetime(now),
             "timezone": timezone_name,
             "event_type": Event.EventType.FEEDING,
         }
 
     @classmethod
     def initial_for_event(cls, event: Event, timezone_name: str) -> dict:
-        from zoneinfo import ZoneInfo
+        """
+        Build form initial data for editing an event.
 
-        tz = ZoneInfo(timezone_name)
+        Pass an event with its detail relations already joined (as returned by
+        event_queryset_for_user); otherwise each detail lookup is its own query.
+        """
+        tz = get_zone(timezone_name)
         initial = {
             "event_type": event.event_type,
-            "occurred_at_local": event.occurred_at_utc.astimezone(tz).strftime(DATETIME_INPUT_FORMAT),
+            "occurred_at_local": _format_input_datetime(event.occurred_at_utc.astimezone(tz)),
             "timezone": timezone_name,
             "notes": event.notes,
         }
 
-        if hasattr(event, "feeding_detail"):
-            detail = event.feeding_detail
+        detail = getattr(event, "feeding_detail", None)
+        if detail is not None:
             initial.update(
                 {
                     "feeding_method": detail.method,
@@ -129,8 +240,8 @@ class EventForm(forms.Form):
                 }
             )
 
-        if hasattr(event, "diaper_detail"):
-            detail = event.diaper_detail
+        detail = getattr(event, "diaper_detail", None)
+        if detail is not None:
             initial.update(
                 {
                     "diaper_type": detail.diaper_type,
@@ -139,19 +250,19 @@ class EventForm(forms.Form):
                 }
             )
 
-        if hasattr(event, "sleep_detail"):
-            detail = event.sleep_detail
+        detail = getattr(event, "sleep_detail", None)
+        if detail is not None:
             initial.update(
                 {
                     "sleep_quality": detail.quality,
-                    "sleep_end_local": detail.end_at_utc.astimezone(tz).strftime(DATETIME_INPUT_FORMAT)
+                    "sleep_end_local": _format_input_datetime(detail.end_at_utc.astimezone(tz))
                     if detail.end_at_utc
                     else None,
                 }
             )
 
-        if hasattr(event, "pumping_detail"):
-            detail = event.pumping_detail
+        detail = getattr(event, "pumping_detail", None)
+        if detail is not None:
             initial.update(
                 {
                     "pumping_amount_ml": detail.amount_ml,
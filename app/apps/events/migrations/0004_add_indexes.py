@@ -0,0 +1,33 @@
+# Generated manually to add lookup indexes without locking the tables.
+
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    atomic = False
+
+    dependencies = [
+        (
+            'events',
+            '0003_rename_events_event_family__b55af7_idx_events_even_family__c6d975_idx_and_more',
+        ),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='idempotencyrecord',
+            index=models.Index(
+                fields=['family', 'baby', '-created_at'],
+                name='idem_fam_baby_created_idx',
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name='event',
+            index=models.Index(
+                fields=['created_by', '-occurred_at_utc'],
+                name='events_createdby_occ_idx',
+            ),
+        ),
+    ]
@@ -0,0 +1,48 @@
+# Generated manually to add per-type partial indexes without locking the table.
+
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    atomic = False
+
+    dependencies = [
+        ('events', '0004_add_indexes'),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='event',
+            index=models.Index(
+                condition=models.Q(('event_type', 'feeding')),
+                fields=['-occurred_at_utc'],
+                name='events_feeding_occ_idx',
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name='event',
+            index=models.Index(
+                condition=models.Q(('event_type', 'diaper')),
+                fields=['-occurred_at_utc'],
+                name='events_diaper_occ_idx',
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name='event',
+            index=models.Index(
+                condition=models.Q(('event_type', 'sleep')),
+                fields=['-occurred_at_utc'],
+                name='events_sleep_occ_idx',
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name='event',
+            index=models.Index(
+                condition=models.Q(('event_type', 'pumping')),
+                fields=['-occurred_at_utc'],
+                name='events_pumping_occ_idx',
+            ),
+        ),
+    ]
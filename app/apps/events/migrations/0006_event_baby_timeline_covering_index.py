@@ -0,0 +1,24 @@
+# Generated manually to add the covering timeline index without locking the table.
+
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    atomic = False
+
+    dependencies = [
+        ('events', '0005_event_type_partial_indexes'),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='event',
+            index=models.Index(
+                fields=['baby', '-occurred_at_utc'],
+                include=('event_type',),
+                name='events_baby_timeline_cov_idx',
+            ),
+        ),
+    ]
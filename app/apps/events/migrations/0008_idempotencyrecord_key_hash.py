@@ -0,0 +1,45 @@
+# Generated manually to look up idempotency records by a fixed-size key digest.
+
+import hashlib
+
+from django.db import migrations, models
+
+
+def backfill_key_hash(apps, schema_editor):
+    IdempotencyRecord = apps.get_model("events", "IdempotencyRecord")
+    records = IdempotencyRecord.objects.only("id", "key")
+    for record in records.iterator(chunk_size=2000):
+        record.key_hash = hashlib.sha256(record.key.encode("utf-8")).digest()
+        record.save(update_fields=["key_hash"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0007_alter_event_id'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='idempotencyrecord',
+            name='key_hash',
+            field=models.BinaryField(max_length=32, null=True),
+        ),
+        migrations.RunPython(backfill_key_hash, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name='idempotencyrecord',
+            name='key_hash',
+            field=models.BinaryField(max_length=32),
+        ),
+        migrations.RemoveConstraint(
+            model_name='idempotencyrecord',
+            name='uniq_user_idempotency_key',
+        ),
+        migrations.AddConstraint(
+            model_name='idempotencyrecord',
+            constraint=models.UniqueConstraint(
+                fields=('user', 'key_hash'),
+                name='uniq_user_idempotency_key_hash',
+            ),
+        ),
+    ]
@@ -0,0 +1,133 @@
+# Generated manually to copy event scope columns onto the detail tables.
+# 0010 tightens the columns; it is separate so the backfill's deferred FK
+# checks are committed before the tables are altered.
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery
+
+DETAIL_MODELS = ("FeedingEvent", "DiaperEvent", "SleepEvent", "PumpingEvent")
+
+
+def copy_event_columns(apps, schema_editor):
+    Event = apps.get_model("events", "Event")
+    for model_name in DETAIL_MODELS:
+        parent = Event.objects.filter(pk=OuterRef("event_id"))
+        apps.get_model("events", model_name).objects.update(
+            family_id=Subquery(parent.values("family_id")[:1]),
+            baby_id=Subquery(parent.values("baby_id")[:1]),
+            occurred_at_utc=Subquery(parent.values("occurred_at_utc")[:1]),
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('babies', '0001_initial'),
+        ('families', '0002_rename_families_fam_user_id_50b8fc_idx_families_fa_user_id_fc0662_idx'),
+        ('events', '0008_idempotencyrecord_key_hash'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='feedingevent',
+            name='family',
+            field=models.ForeignKey(
+                null=True,
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name='+',
+                to='families.family',
+            ),
+        ),
+        migrations.AddField(
+            model_name='feedingevent',
+            name='baby',
+            field=models.ForeignKey(
+                null=True,
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name='+',
+                to='babies.baby',
+            ),
+        ),
+        migrations.AddField(
+            model_name='feedingevent',
+            name='occurred_at_utc',
+            field=models.DateTimeField(null=True),
+        ),
+        migrations.AddField(
+            model_name='diaperevent',
+            name='family',
+            field=models.ForeignKey(
+                null=True,
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name='+',
+                to='families.family',
+            ),
+        ),
+        migrations.AddField(
+            model_name='diaperevent',
+            name='baby',
+            field=models.ForeignKey(
+                null=True,
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name='+',
+                to='babies.baby',
+            ),
+        ),
+        migrations.AddField(
+            model_name='diaperevent',
+            name='occurred_at_utc',
+            field=models.DateTimeField(null=True),
+        ),
+        migrations.AddField(
+            model_name='sleepevent',
+            name='family',
+            field=models.ForeignKey(
+                null=True,
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name='+',
+                to='families.family',
+            ),
+        ),
+        migrations.AddField(
+            model_name='sleepevent',
+            name='baby',
+            field=models.ForeignKey(
+                null=True,
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name='+',
+                to='babies.baby',
+            ),
+        ),
+        migrations.AddField(
+            model_name='sleepevent',
+            name='occurred_at_utc',
+            field=models.DateTimeField(null=True),
+        ),
+        migrations.AddField(
+            model_name='pumpingevent',
+            name='family',
+            field=models.ForeignKey(
+                null=True,
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name='+',
+                to='families.family',
+            ),
+        ),
+        migrations.AddField(
+            model_name='pumpingevent',
+            name='baby',
+            field=models.ForeignKey(
+                null=True,
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name='+',
+                to='babies.baby',
+            ),
+        ),
+        migrations.AddField(
+            model_name='pumpingevent',
+            name='occurred_at_utc',
+            field=models.DateTimeField(null=True),
+        ),
+        migrations.RunPython(copy_event_columns, migrations.RunPython.noop),
+    ]
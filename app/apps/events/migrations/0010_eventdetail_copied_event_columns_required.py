@@ -0,0 +1,134 @@
+# Generated manually to require the copied event columns and index them.
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0009_eventdetail_copied_event_columns'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='feedingevent',
+            name='family',
+            field=models.ForeignKey(
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name='+',
+                to='families.family',
+            ),
+        ),
+        migrations.AlterField(
+            model_name='feedingevent',
+            name='baby',
+            field=models.ForeignKey(
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name='+',
+                to='babies.baby',
+            ),
+        ),
+        migrations.AlterField(
+            model_name='feedingevent',
+            name='occurred_at_utc',
+            field=models.DateTimeField(),
+        ),
+        migrations.AlterField(
+            model_name='diaperevent',
+            name='family',
+            field=models.ForeignKey(
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name='+',
+                to='families.family',
+            ),
+        ),
+        migrations.AlterField(
+            model_name='diaperevent',
+            name='baby',
+            field=models.ForeignKey(
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name='+',
+                to='babies.baby',
+            ),
+        ),
+        migrations.AlterField(
+            model_name='diaperevent',
+            name='occurred_at_utc',
+            field=models.DateTimeField(),
+        ),
+        migrations.AlterField(
+            model_name='sleepevent',
+            name='family',
+            field=models.ForeignKey(
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name='+',
+                to='families.family',
+            ),
+        ),
+        migrations.AlterField(
+            model_name='sleepevent',
+            name='baby',
+            field=models.ForeignKey(
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name='+',
+                to='babies.baby',
+            ),
+        ),
+        migrations.AlterField(
+            model_name='sleepevent',
+            name='occurred_at_utc',
+            field=models.DateTimeField(),
+        ),
+        migrations.AlterField(
+            model_name='pumpingevent',
+            name='family',
+            field=models.ForeignKey(
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name='+',
+                to='families.family',
+            ),
+        ),
+        migrations.AlterField(
+            model_name='pumpingevent',
+            name='baby',
+            field=models.ForeignKey(
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name='+',
+                to='babies.baby',
+            ),
+        ),
+        migrations.AlterField(
+            model_name='pumpingevent',
+            name='occurred_at_utc',
+            field=models.DateTimeField(),
+        ),
+        migrations.AddIndex(
+            model_name='feedingevent',
+            index=models.Index(
+                fields=['family', '-occurred_at_utc'],
+                name='events_feedingevent_fam_occ',
+            ),
+        ),
+        migrations.AddIndex(
+            model_name='diaperevent',
+            index=models.Index(
+                fields=['family', '-occurred_at_utc'],
+                name='events_diaperevent_fam_occ',
+            ),
+        ),
+        migrations.AddIndex(
+            model_name='sleepevent',
+            index=models.Index(
+                fields=['family', '-occurred_at_utc'],
+                name='events_sleepevent_fam_occ',
+            ),
+        ),
+        migrations.AddIndex(
+            model_name='pumpingevent',
+            index=models.Index(
+                fields=['family', '-occurred_at_utc'],
+                name='events_pumpingevent_fam_occ',
+            ),
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated manually to add the family timeline index without locking the table.
+
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    atomic = False
+
+    dependencies = [
+        ('events', '0010_eventdetail_copied_event_columns_required'),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='event',
+            index=models.Index(
+                fields=['family', '-occurred_at_utc'],
+                name='events_family_occurred_idx',
+            ),
+        ),
+    ]
@@ -1,14 +1,31 @@
 from __future__ import annotations
 
-import uuid
-
 from django.conf import settings
 from django.db import models
 
 from apps.babies.models import Baby
+from apps.common.ids import uuid7
 from apps.families.models import Family
 
 
+class EventQuerySet(models.QuerySet):
+    def for_list(self):
+        """
+        Load only the columns list views render.
+
+        Reading any other field (notes, timezone, schema_version, audit fields)
+        on the results costs one extra query per instance.
+        """
+        return self.only(
+            "id",
+            "event_type",
+            "occurred_at_utc",
+            "baby",
+            "family",
+            "created_by",
+        )
+
+
 class Event(models.Model):
     class EventType(models.TextChoices):
         FEEDING = "feeding", "Feeding"
@@ -16,7 +33,8 @@ class Event(models.Model):
         SLEEP = "sleep", "Sleep"
         PUMPING = "pumping", "Pumping"
 
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    # Time-ordered so inserts append to the primary key and FK indexes.
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     family = models.ForeignKey(Family, on_delete=models.CASCADE, related_name="events")
     baby = models.ForeignKey(Baby, on_delete=models.CASCADE, related_name="events")
     event_type = models.CharField(max_length=16, choices=EventType.choices)
@@ -39,18 +57,83 @@ class Event(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = EventQuerySet.as_manager()
+
     class Meta:
         ordering = ["-occurred_at_utc", "-created_at"]
         indexes = [
             models.Index(fields=["family", "baby", "-occurred_at_utc"]),
             models.Index(fields=["event_type", "-occurred_at_utc"]),
+            models.Index(
+                fields=["created_by", "-occurred_at_utc"],
+                name="events_createdby_occ_idx",
+            ),
+            models.Index(
+                fields=["family", "-occurred_at_utc"],
+                name="events_family_occurred_idx",
+            ),
+            # Covers the per-baby timeline so type badges can come from an index-only scan.
+            models.Index(
+                fields=["baby", "-occurred_at_utc"],
+                name="events_baby_timeline_cov_idx",
+                include=["event_type"],
+            ),
+            # Per-type partial indexes for single-type listings and dashboards.
+            models.Index(
+                fields=["-occurred_at_utc"],
+                name="events_feeding_occ_idx",
+                condition=models.Q(event_type="feeding"),
+            ),
+            models.Index(
+                fields=["-occurred_at_utc"],
+                name="events_diaper_occ_idx",
+                condition=models.Q(event_type="diaper"),
+            ),
+            models.Index(
+                fields=["-occurred_at_utc"],
+                name="events_sleep_occ_idx",
+                condition=models.Q(event_type="sleep"),
+            ),
+            models.Index(
+                fields=["-occurred_at_utc"],
+                name="events_pumping_occ_idx",
+                condition=models.Q(event_type="pumping"),
+            ),
         ]
 
     def __str__(self) -> str:
         return f"{self.event_type} for {self.baby.name}"
 
 
-class FeedingEvent(models.Model):
+# Dense integer tags for Event.EventType values, in declaration order, for
+# dispatch tables indexed by event type.
+EVENT_TYPE_CODE = {value: code for code, value in enumerate(Event.EventType.values)}
+
+
+class EventDetail(models.Model):
+    """
+    Base for the per-type detail tables.
+
+    family, baby and occurred_at_utc are copies of the parent event's columns so
+    per-type reporting can scan a detail table without joining events. They are
+    written by apps.events.services.event_detail_copy_fields.
+    """
+
+    family = models.ForeignKey(Family, on_delete=models.CASCADE, related_name="+")
+    baby = models.ForeignKey(Baby, on_delete=models.CASCADE, related_name="+")
+    occurred_at_utc = models.DateTimeField()
+
+    class Meta:
+        abstract = True
+        indexes = [
+            models.Index(
+                fields=["family", "-occurred_at_utc"],
+                name="%(app_label)s_%(class)s_fam_occ",
+            ),
+        ]
+
+
+class FeedingEvent(EventDetail):
     class Method(models.TextChoices):
         BREAST = "breast", "Breast"
         BOTTLE = "bottle", "Bottle"
@@ -70,7 +153,7 @@ class FeedingEvent(models.Model):
     duration_min = models.PositiveIntegerField(null=True, blank=True)
 
 
-class DiaperEvent(models.Model):
+class DiaperEvent(EventDetail):
     class DiaperType(models.TextChoices):
         WET = "wet", "Wet"
         DIRTY = "dirty", "Dirty"
@@ -83,7 +166,7 @@ class DiaperEvent(models.Model):
     consistency = models.CharField(max_length=64, blank=True)
 
 
-class SleepEvent(models.Model):
+class SleepEvent(EventDetail):
     class Quality(models.TextChoices):
         GOOD = "good", "Good"
         OK = "ok", "OK"
@@ -96,7 +179,7 @@ class SleepEvent(models.Model):
     quality = models.CharField(max_length=16, choices=Quality.choices, default=Quality.UNKNOWN)
 
 
-class PumpingEvent(models.Model):
+class PumpingEvent(EventDetail):
     class Side(models.TextChoices):
         LEFT = "left", "Left"
         RIGHT = "right", "Right"
@@ -114,7 +197,9 @@ class IdempotencyRecord(models.Model):
         on_delete=models.CASCADE,
         related_name="event_idempotency_records",
     )
+    # Kept for debugging; uniqueness and lookups go through key_hash (SHA-256 of key).
     key = models.CharField(max_length=128)
+    key_hash = models.BinaryField(max_length=32)
     family = models.ForeignKey(Family, on_delete=models.CASCADE, related_name="idempotency_records")
     baby = models.ForeignKey(Baby, on_delete=models.CASCADE, related_name="idempotency_records")
     event = models.OneToOneField(
@@ -129,7 +214,13 @@ class IdempotencyRecord(models.Model):
     class Meta:
         constraints = [
             models.UniqueConstraint(
-                fields=["user", "key"],
-                name="uniq_user_idempotency_key",
+                fields=["user", "key_hash"],
+                name="uniq_user_idempotency_key_hash",
             )
         ]
+        indexes = [
+            models.Index(
+                fields=["family", "baby", "-created_at"],
+                name="idem_fam_baby_created_idx",
+            ),
+        ]
@@ -1,19 +1,30 @@
 from __future__ import annotations
 
+import base64
+import binascii
+import hashlib
+import uuid
 from dataclasses import dataclass
 from datetime import UTC, date, datetime, time, timedelta
-from zoneinfo import ZoneInfo
 
+from django.core.cache import cache, caches
+from django.core.cache.backends.locmem import LocMemCache
 from django.core.exceptions import PermissionDenied, ValidationError
-from django.db import transaction
-from django.db.models import Count
+from django.db import connection, transaction
+from django.db.models import Count, Exists, Max, OuterRef, Q
+from django.db.models.functions import TruncDate
 from django.utils import timezone
 
 from apps.babies.models import Baby
+from apps.common.timezones import INVALID_ZONE_ERRORS, get_zone
+from apps.families.models import FamilyMembership
 from apps.families.services import require_family_membership, require_family_write
 
 from .models import DiaperEvent, Event, FeedingEvent, IdempotencyRecord, PumpingEvent, SleepEvent
 
+# Dashboard stats are cached per family; writes bump the version to invalidate.
+STATS_CACHE_TIMEOUT = 300
+
 
 @dataclass
 class SummaryWindow:
@@ -23,14 +34,13 @@ class SummaryWindow:
 
 def _normalize_occurrence(occurred_local: datetime, timezone_name: str) -> datetime:
     try:
-        tz = ZoneInfo(timezone_name)
-    except Exception as exc:  # pragma: no cover - defensive fallback
+        tz = get_zone(timezone_name)
+    except INVALID_ZONE_ERRORS as exc:
         raise ValidationError("Invalid timezone") from exc
 
+    # Aware input already names its instant; converting via tz first is a no-op.
     if occurred_local.tzinfo is None:
-        occurred_local = occurred_local.replace(tzinfo=tz)
-    else:
-        occurred_local = occurred_local.astimezone(tz)
+        return occurred_local.replace(tzinfo=tz).astimezone(UTC)
     return occurred_local.astimezone(UTC)
 
 
@@ -40,57 +50,197 @@ def _normalize_local_to_utc(value: datetime | None, timezone_name: str) -> datet
     return _normalize_occurrence(value, timezone_name)
 
 
+_DETAIL_MODELS = (FeedingEvent, DiaperEvent, SleepEvent, PumpingEvent)
+
+
+def event_detail_copy_fields(event: Event) -> dict:
+    """Columns each detail row copies from its event (see EventDetail)."""
+    return {
+        "family_id": event.family_id,
+        "baby_id": event.baby_id,
+        "occurred_at_utc": event.occurred_at_utc,
+    }
+
+
+def sync_event_detail_copies(event: Event) -> None:
+    """Refresh the copied event columns on detail rows after an out-of-band event edit."""
+    copy_fields = event_detail_copy_fields(event)
+    for model in _DETAIL_MODELS:
+        model.objects.filter(event=event).update(**copy_fields)
+
+
+def _upsert_detail(model, event: Event, values: dict) -> None:
+    """Insert or update ``event``'s ``model`` row in one INSERT ... ON CONFLICT statement."""
+    model.objects.bulk_create(
+        [model(event=event, **values)],
+        update_conflicts=True,
+        unique_fields=["event"],
+        update_fields=list(values),
+    )
+
+
+def _apply_feeding(event: Event, details: dict) -> None:
+    _upsert_detail(
+        FeedingEvent,
+        event,
+        {
+            **event_detail_copy_fields(event),
+            "method": details.get("method", ""),
+            "amount_ml": details.get("amount_ml"),
+            "side": details.get("side", ""),
+            "duration_min": details.get("duration_min"),
+        },
+    )
+
+
+def _apply_diaper(event: Event, details: dict) -> None:
+    diaper_type = details.get("diaper_type")
+    if not diaper_type:
+        raise ValidationError("diaper_type is required for diaper events")
+    _upsert_detail(
+        DiaperEvent,
+        event,
+        {
+            **event_detail_copy_fields(event),
+            "diaper_type": diaper_type,
+            "color": details.get("color", ""),
+            "consistency": details.get("consistency", ""),
+        },
+    )
+
+
+def _apply_sleep(event: Event, details: dict) -> None:
+    _upsert_detail(
+        SleepEvent,
+        event,
+        {
+            **event_detail_copy_fields(event),
+            "start_at_utc": event.occurred_at_utc,
+            "end_at_utc": _normalize_local_to_utc(details.get("sleep_end_local"), event.timezone),
+            "quality": details.get("quality", SleepEvent.Quality.UNKNOWN),
+        },
+    )
+
+
+def _apply_pumping(event: Event, details: dict) -> None:
+    if not details.get("amount_ml") and not details.get("duration_min"):
+        raise ValidationError("Pumping events require amount_ml or duration_min")
+    _upsert_detail(
+        PumpingEvent,
+        event,
+        {
+            **event_detail_copy_fields(event),
+            "amount_ml": details.get("amount_ml"),
+            "duration_min": details.get("duration_min"),
+            "side": details.get("side", ""),
+        },
+    )
+
+
+_DETAIL_APPLIERS = {
+    Event.EventType.FEEDING: _apply_feeding,
+    Event.EventType.DIAPER: _apply_diaper,
+    Event.EventType.SLEEP: _apply_sleep,
+    Event.EventType.PUMPING: _apply_pumping,
+}
+
+
 def _apply_detail(event: Event, details: dict) -> None:
-    EventType = Event.EventType
-    if event.event_type == EventType.FEEDING:
-        FeedingEvent.objects.update_or_create(
-            event=event,
-            defaults={
-                "method": details.get("method", ""),
-                "amount_ml": details.get("amount_ml"),
-                "side": details.get("side", ""),
-                "duration_min": details.get("duration_min"),
-            },
-        )
-    elif event.event_type == EventType.DIAPER:
-        diaper_type = details.get("diaper_type")
-        if not diaper_type:
-            raise ValidationError("diaper_type is required for diaper events")
-        DiaperEvent.objects.update_or_create(
-            event=event,
-            defaults={
-                "diaper_type": diaper_type,
-                "color": details.get("color", ""),
-                "consistency": details.get("consistency", ""),
-            },
-        )
-    elif event.event_type == EventType.SLEEP:
-        SleepEvent.objects.update_or_create(
-            event=event,
-            defaults={
-                "start_at_utc": event.occurred_at_utc,
-                "end_at_utc": _normalize_local_to_utc(details.get("sleep_end_local"), event.timezone),
-                "quality": details.get("quality", SleepEvent.Quality.UNKNOWN),
-            },
-        )
-    elif event.event_type == EventType.PUMPING:
-        if not details.get("amount_ml") and not details.get("duration_min"):
-            raise ValidationError("Pumping events require amount_ml or duration_min")
-        PumpingEvent.objects.update_or_create(
-            event=event,
-            defaults={
-                "amount_ml": details.get("amount_ml"),
-                "duration_min": details.get("duration_min"),
-                "side": details.get("side", ""),
-            },
-        )
+    applier = _DETAIL_APPLIERS.get(event.event_type)
+    if applier is not None:
+        applier(event, details)
+
+
+def _delete_details_sql(models) -> str:
+    """One statement deleting an event's rows from each of ``models``' tables."""
+    *ctes, last = (
+        f"DELETE FROM {model._meta.db_table} WHERE event_id = %(event_id)s" for model in models
+    )
+    if not ctes:
+        return last
+    with_clause = ", ".join(f"d{index} AS ({sql})" for index, sql in enumerate(ctes))
+    return f"WITH {with_clause} {last}"
+
+
+_DETAIL_MODEL_BY_TYPE = {
+    Event.EventType.FEEDING: FeedingEvent,
+    Event.EventType.DIAPER: DiaperEvent,
+    Event.EventType.SLEEP: SleepEvent,
+    Event.EventType.PUMPING: PumpingEvent,
+}
+
+# Per event type, the statement that removes detail rows of every other type.
+_CLEAR_OTHER_DETAILS_SQL = {
+    event_type: _delete_details_sql([other for other in _DETAIL_MODELS if other is not model])
+    for event_type, model in _DETAIL_MODEL_BY_TYPE.items()
+}
+_CLEAR_ALL_DETAILS_SQL = _delete_details_sql(_DETAIL_MODELS)
 
 
 def _clear_other_details(event: Event) -> None:
-    FeedingEvent.objects.filter(event=event).delete()
-    DiaperEvent.objects.filter(event=event).delete()
-    SleepEvent.objects.filter(event=event).delete()
-    PumpingEvent.objects.filter(event=event).delete()
+    """Delete detail rows that do not match event.event_type; _apply_detail upserts the rest."""
+    sql = _CLEAR_OTHER_DETAILS_SQL.get(event.event_type, _CLEAR_ALL_DETAILS_SQL)
+    with connection.cursor() as cursor:
+        cursor.execute(sql, {"event_id": event.id})
+
+
+def _idempotency_key_hash(key: str) -> bytes:
+    return hashlib.sha256(key.encode("utf-8")).digest()
+
+
+# Claims an idempotency key and inserts its event in one statement. The event row
+# is only written when the key was not already taken; the record's FK to it is
+# deferred to commit, so inserting the record first is fine.
+_CLAIM_KEY_AND_INSERT_EVENT_SQL = f"""
+WITH claimed AS (
+    INSERT INTO {IdempotencyRecord._meta.db_table}
+        (user_id, key, key_hash, family_id, baby_id, event_id, created_at)
+    VALUES
+        (%(user_id)s, %(key)s, %(key_hash)s, %(family_id)s, %(baby_id)s, %(event_id)s, %(now)s)
+    ON CONFLICT (user_id, key_hash) DO NOTHING
+    RETURNING event_id
+)
+INSERT INTO {Event._meta.db_table}
+    (id, family_id, baby_id, event_type, occurred_at_utc, timezone, notes,
+     schema_version, created_by_id, created_at, updated_at)
+SELECT
+    event_id, %(family_id)s, %(baby_id)s, %(event_type)s, %(occurred_at_utc)s, %(timezone)s,
+    %(notes)s, %(schema_version)s, %(user_id)s, %(now)s, %(now)s
+FROM claimed
+RETURNING id
+"""
+
+
+def _claim_key_and_insert_event(user, baby: Baby, event: Event, idempotency_key: str) -> bool:
+    """Insert ``event`` under ``idempotency_key``; False if the key was already claimed."""
+    with connection.cursor() as cursor:
+        cursor.execute(
+            _CLAIM_KEY_AND_INSERT_EVENT_SQL,
+            {
+                "user_id": user.pk,
+                "key": idempotency_key,
+                "key_hash": _idempotency_key_hash(idempotency_key),
+                "family_id": baby.family_id,
+                "baby_id": baby.id,
+                "event_id": event.id,
+                "event_type": event.event_type,
+                "occurred_at_utc": event.occurred_at_utc,
+                "timezone": event.timezone,
+                "notes": event.notes,
+                "schema_version": event.schema_version,
+                "now": event.created_at,
+            },
+        )
+        if cursor.fetchone() is None:
+            return False
+
+    event._state.adding = False
+    event._state.db = connection.alias
+    # The raw insert skips Event's post_save receivers, so bump here, after commit
+    # like they do.
+    family_id = baby.family_id
+    transaction.on_commit(lambda: bump_stats_cache_version(family_id))
+    return True
 
 
 @transaction.atomic
@@ -98,22 +248,7 @@ def create_event_for_baby(user, baby: Baby, payload: dict, *, idempotency_key: s
     require_family_write(user, baby.family)
     occurred_at_utc = _normalize_occurrence(payload["occurred_at_local"], payload["timezone"])
 
-    idempotency_record = None
-    if idempotency_key:
-        idempotency_record, created = IdempotencyRecord.objects.select_for_update().get_or_create(
-            user=user,
-            key=idempotency_key,
-            defaults={
-                "family": baby.family,
-                "baby": baby,
-            },
-        )
-        if not created and idempotency_record.event_id:
-            return idempotency_record.event
-        if idempotency_record.family_id != baby.family_id or idempotency_record.baby_id != baby.id:
-            raise ValidationError("Idempotency key has already been used with a different resource.")
-
-    event = Event.objects.create(
+    event = Event(
         family=baby.family,
         baby=baby,
         event_type=payload["event_type"],
@@ -122,12 +257,30 @@ def create_event_for_baby(user, baby: Baby, payload: dict, *, idempotency_key: s
         notes=payload.get("notes", ""),
         created_by=user,
     )
-    _apply_detail(event, payload.get("details", {}))
 
-    if idempotency_record and not idempotency_record.event_id:
-        idempotency_record.event = event
-        idempotency_record.save(update_fields=["event"])
+    if not idempotency_key:
+        event.save(force_insert=True)
+    else:
+        event.created_at = event.updated_at = timezone.now()
+        if not _claim_key_and_insert_event(user, baby, event, idempotency_key):
+            idempotency_record = IdempotencyRecord.objects.select_related("event").get(
+                user=user, key_hash=_idempotency_key_hash(idempotency_key)
+            )
+            if idempotency_record.event_id:
+                return idempotency_record.event
+            if (
+                idempotency_record.family_id != baby.family_id
+                or idempotency_record.baby_id != baby.id
+            ):
+                raise ValidationError(
+                    "Idempotency key has already been used with a different resource."
+                )
+            # A record without an event predates the single-statement claim; finish it.
+            event.save(force_insert=True)
+            idempotency_record.event = event
+            idempotency_record.save(update_fields=["event"])
 
+    _apply_detail(event, payload.get("details", {}))
     return event
 
 
@@ -154,21 +307,62 @@ def delete_event(user, event: Event) -> None:
 
 
 def event_queryset_for_user(user):
-    return (
-        Event.objects.filter(family__memberships__user=user)
-        .select_related(
-            "baby",
-            "family",
-            "created_by",
-            "feeding_detail",
-            "diaper_detail",
-            "sleep_detail",
-            "pumping_detail",
-        )
-        .distinct()
+    # A semi-join on membership cannot duplicate rows, so no DISTINCT is needed.
+    is_member = FamilyMembership.objects.filter(family_id=OuterRef("family_id"), user=user)
+    return Event.objects.filter(Exists(is_member)).select_related(
+        "baby",
+        "family",
+        "created_by",
+        "feeding_detail",
+        "diaper_detail",
+        "sleep_detail",
+        "pumping_detail",
     )
 
 
+def events_state_token(queryset) -> str:
+    """
+    A string that changes whenever an event in ``queryset`` is created, edited or deleted.
+
+    Built from COUNT and MAX(updated_at) in one aggregate; the count catches
+    deletes, which leave the latest updated_at unchanged.
+    """
+    state = queryset.order_by().aggregate(count=Count("id"), last_updated=Max("updated_at"))
+    last_updated = state["last_updated"].isoformat() if state["last_updated"] else ""
+    return f"{state['count']}|{last_updated}"
+
+
+def encode_event_cursor(occurred_at_utc: datetime, event_id) -> str:
+    raw = f"{occurred_at_utc.isoformat()}|{event_id}"
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii")
+
+
+def decode_event_cursor(token: str) -> tuple[datetime, uuid.UUID]:
+    try:
+        raw = base64.urlsafe_b64decode(token.encode("ascii")).decode("utf-8")
+        ts_raw, id_raw = raw.split("|", 1)
+        return datetime.fromisoformat(ts_raw), uuid.UUID(id_raw)
+    except (binascii.Error, UnicodeError, ValueError) as exc:
+        raise ValueError("Invalid cursor") from exc
+
+
+def events_after_cursor(queryset, cursor: str | None):
+    """
+    Order events newest first by (occurred_at_utc, id) and keep those after ``cursor``.
+
+    The row-value comparison is a range scan on the occurred_at_utc indexes, so
+    deep pages cost the same as the first. Raises ValueError for a malformed
+    cursor.
+    """
+    queryset = queryset.order_by("-occurred_at_utc", "-id")
+    if cursor:
+        cursor_ts, cursor_id = decode_event_cursor(cursor)
+        queryset = queryset.filter(
+            Q(occurred_at_utc__lt=cursor_ts) | Q(occurred_at_utc=cursor_ts, id__lt=cursor_id)
+        )
+    return queryset
+
+
 def require_event_access(user, event_id):
     event = event_queryset_for_user(user).filter(id=event_id).first()
     if event is None:
@@ -185,51 +379,88 @@ def require_baby_access(user, baby_id):
     return baby
 
 
+# Detail columns per event type, as (relation, fields); used by both event serializers.
+_DETAIL_VALUE_FIELDS = {
+    Event.EventType.FEEDING: ("feeding_detail", ("method", "amount_ml", "side", "duration_min")),
+    Event.EventType.DIAPER: ("diaper_detail", ("diaper_type", "color", "consistency")),
+    Event.EventType.SLEEP: ("sleep_detail", ("start_at_utc", "end_at_utc", "quality")),
+    Event.EventType.PUMPING: ("pumping_detail", ("amount_ml", "duration_min", "side")),
+}
+
+
 def serialize_event(event: Event) -> dict:
+    """Return the API shape of an event; encode with apps.common.http.json_dumps."""
     details: dict[str, object] = {}
-    if hasattr(event, "feeding_detail"):
-        details = {
-            "method": event.feeding_detail.method,
-            "amount_ml": event.feeding_detail.amount_ml,
-            "side": event.feeding_detail.side,
-            "duration_min": event.feeding_detail.duration_min,
-        }
-    elif hasattr(event, "diaper_detail"):
-        details = {
-            "diaper_type": event.diaper_detail.diaper_type,
-            "color": event.diaper_detail.color,
-            "consistency": event.diaper_detail.consistency,
-        }
-    elif hasattr(event, "sleep_detail"):
-        details = {
-            "start_at_utc": event.sleep_detail.start_at_utc.isoformat(),
-            "end_at_utc": event.sleep_detail.end_at_utc.isoformat() if event.sleep_detail.end_at_utc else None,
-            "quality": event.sleep_detail.quality,
-        }
-    elif hasattr(event, "pumping_detail"):
-        details = {
-            "amount_ml": event.pumping_detail.amount_ml,
-            "duration_min": event.pumping_detail.duration_min,
-            "side": event.pumping_detail.side,
-        }
+    detail_spec = _DETAIL_VALUE_FIELDS.get(event.event_type)
+    if detail_spec is not None:
+        relation, fields = detail_spec
+        detail = getattr(event, relation, None)
+        if detail is not None:
+            details = {field: getattr(detail, field) for field in fields}
 
     return {
-        "id": str(event.id),
-        "family_id": str(event.family_id),
-        "baby_id": str(event.baby_id),
+        "id": event.id,
+        "family_id": event.family_id,
+        "baby_id": event.baby_id,
         "event_type": event.event_type,
-        "occurred_at_utc": event.occurred_at_utc.isoformat(),
+        "occurred_at_utc": event.occurred_at_utc,
         "timezone": event.timezone,
         "notes": event.notes,
         "schema_version": event.schema_version,
         "created_by": event.created_by_id,
-        "created_at": event.created_at.isoformat(),
-        "updated_at": event.updated_at.isoformat(),
+        "created_at": event.created_at,
+        "updated_at": event.updated_at,
+        "details": details,
+    }
+
+
+EVENT_VALUES_FIELDS = (
+    "id",
+    "family_id",
+    "baby_id",
+    "event_type",
+    "occurred_at_utc",
+    "timezone",
+    "notes",
+    "schema_version",
+    "created_by_id",
+    "created_at",
+    "updated_at",
+    *(
+        f"{relation}__{field}"
+        for relation, fields in _DETAIL_VALUE_FIELDS.values()
+        for field in ("id", *fields)
+    ),
+)
+
+
+def serialize_event_values(row: dict) -> dict:
+    """serialize_event for a ``.values(*EVENT_VALUES_FIELDS)`` row, without model instances."""
+    details: dict[str, object] = {}
+    detail_spec = _DETAIL_VALUE_FIELDS.get(row["event_type"])
+    if detail_spec is not None:
+        relation, fields = detail_spec
+        if row[f"{relation}__id"] is not None:
+            details = {field: row[f"{relation}__{field}"] for field in fields}
+
+    return {
+        "id": row["id"],
+        "family_id": row["family_id"],
+        "baby_id": row["baby_id"],
+        "event_type": row["event_type"],
+        "occurred_at_utc": row["occurred_at_utc"],
+        "timezone": row["timezone"],
+        "notes": row["notes"],
+        "schema_version": row["schema_version"],
+        "created_by": row["created_by_id"],
+        "created_at": row["created_at"],
+        "updated_at": row["updated_at"],
         "details": details,
     }
 
 
 def summarize_baby_events(baby: Baby, start: datetime, end: datetime) -> SummaryWindow:
+    """Count events per type in [start, end] with one aggregate query."""
     aggregates = (
         Event.objects.filter(baby=baby, occurred_at_utc__gte=start, occurred_at_utc__lte=end)
         .values("event_type")
@@ -240,27 +471,69 @@ def summarize_baby_events(baby: Baby, start: datetime, end: datetime) -> Summary
     return SummaryWindow(total=total, by_type=by_type)
 
 
-def daily_summary(baby: Baby, local_day: date, timezone_name: str) -> SummaryWindow:
-    tz = ZoneInfo(timezone_name)
-    start_local = datetime.combine(local_day, time.min).replace(tzinfo=tz)
-    end_local = datetime.combine(local_day, time.max).replace(tzinfo=tz)
-    return summarize_baby_events(
-        baby=baby,
-        start=start_local.astimezone(UTC),
-        end=end_local.astimezone(UTC),
+def _local_days_utc_bounds(
+    start_day: date, end_day: date, timezone_name: str
+) -> tuple[datetime, datetime]:
+    """UTC bounds [start, end] of the local days ``start_day`` to ``end_day`` inclusive."""
+    tz = get_zone(timezone_name)
+    start_local = datetime.combine(start_day, time.min).replace(tzinfo=tz)
+    end_local = datetime.combine(end_day, time.max).replace(tzinfo=tz)
+    return start_local.astimezone(UTC), end_local.astimezone(UTC)
+
+
+def summary_state_token(baby: Baby, start_day: date, end_day: date, timezone_name: str) -> str:
+    """
+    events_state_token() over just the events a summary of these local days reads.
+
+    Count and MAX(updated_at) within the window still change when an event in
+    it is created, edited or deleted, or moved into or out of it.
+    """
+    start, end = _local_days_utc_bounds(start_day, end_day, timezone_name)
+    return events_state_token(
+        Event.objects.filter(baby=baby, occurred_at_utc__gte=start, occurred_at_utc__lte=end)
     )
 
 
+def daily_summary(baby: Baby, local_day: date, timezone_name: str) -> SummaryWindow:
+    start, end = _local_days_utc_bounds(local_day, local_day, timezone_name)
+    return summarize_baby_events(baby=baby, start=start, end=end)
+
+
 def range_summary(baby: Baby, start_day: date, end_day: date, timezone_name: str) -> SummaryWindow:
-    tz = ZoneInfo(timezone_name)
-    start_local = datetime.combine(start_day, time.min).replace(tzinfo=tz)
-    end_local = datetime.combine(end_day, time.max).replace(tzinfo=tz)
-    return summarize_baby_events(
-        baby=baby,
-        start=start_local.astimezone(UTC),
-        end=end_local.astimezone(UTC),
+    start, end = _local_days_utc_bounds(start_day, end_day, timezone_name)
+    return summarize_baby_events(baby=baby, start=start, end=end)
+
+
+def daily_summaries_for_range(
+    baby: Baby, start_day: date, end_day: date, timezone_name: str
+) -> dict[date, SummaryWindow]:
+    """
+    Per-day event counts for an inclusive range of local days, in one query.
+
+    The database buckets events by local day (TruncDate in ``timezone_name``)
+    and counts per (day, event_type). Every day in the range is present in the
+    result, with zero counts for days without events.
+    """
+    tz = get_zone(timezone_name)
+    start, end = _local_days_utc_bounds(start_day, end_day, timezone_name)
+    rows = (
+        Event.objects.filter(baby=baby, occurred_at_utc__gte=start, occurred_at_utc__lte=end)
+        .annotate(local_day=TruncDate("occurred_at_utc", tzinfo=tz))
+        .values("local_day", "event_type")
+        .annotate(count=Count("id"))
+        .order_by()
     )
 
+    days = {
+        start_day + timedelta(days=offset): SummaryWindow(total=0, by_type={})
+        for offset in range((end_day - start_day).days + 1)
+    }
+    for row in rows:
+        window = days[row["local_day"]]
+        window.by_type[row["event_type"]] = row["count"]
+        window.total += row["count"]
+    return days
+
 
 def recent_counts_for_family(family_id, hours: int = 24) -> dict[str, int]:
     cutoff = timezone.now() - timedelta(hours=hours)
@@ -270,3 +543,66 @@ def recent_counts_for_family(family_id, hours: int = 24) -> dict[str, int]:
         .annotate(count=Count("id"))
     )
     return {row["event_type"]: row["count"] for row in counts}
+
+
+def dashboard_counts(family_id, baby_id=None) -> dict[str, int]:
+    """
+    Dashboard counters in a single conditional-aggregate query.
+
+    Per-type and ``last_24h`` counts cover the whole family; ``last_7d`` and
+    ``last_30d`` cover ``baby_id`` only and are zero when no baby is given.
+    """
+    now = timezone.now()
+    day_ago = now - timedelta(hours=24)
+    recent = Q(occurred_at_utc__gte=day_ago)
+    aggregates = {
+        "last_24h": Count("id", filter=recent),
+        **{
+            event_type: Count("id", filter=recent & Q(event_type=event_type))
+            for event_type in Event.EventType.values
+        },
+    }
+    if baby_id is not None:
+        in_past = Q(baby_id=baby_id, occurred_at_utc__lte=now)
+        aggregates["last_7d"] = Count(
+            "id", filter=in_past & Q(occurred_at_utc__gte=now - timedelta(days=7))
+        )
+        aggregates["last_30d"] = Count("id", filter=in_past)
+
+    counts = Event.objects.filter(
+        family_id=family_id,
+        occurred_at_utc__gte=now - timedelta(days=30),
+    ).aggregate(**aggregates)
+    counts.setdefault("last_7d", 0)
+    counts.setdefault("last_30d", 0)
+    return counts
+
+
+def stats_cache_is_shared() -> bool:
+    """
+    Whether the default cache is shared between worker processes.
+
+    Version bumps only reach the process that made the write when each worker
+    has its own local-memory cache, so other workers would keep serving stale
+    stats; callers skip the stats cache in that case.
+    """
+    return not isinstance(caches["default"], LocMemCache)
+
+
+def _stats_version_key(family_id) -> str:
+    return f"stats_ver:{family_id}"
+
+
+def stats_cache_version(family_id) -> int:
+    return cache.get(_stats_version_key(family_id), 1)
+
+
+def bump_stats_cache_version(family_id) -> None:
+    key = _stats_version_key(family_id)
+    # Readers default to version 1, so the first bump starts at 2.
+    if cache.add(key, 2, timeout=None):
+        return
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.set(key, 2, timeout=None)
@@ -0,0 +1,17 @@
+from __future__ import annotations
+
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .models import Event
+from .services import bump_stats_cache_version
+
+
+@receiver(post_save, sender=Event)
+@receiver(post_delete, sender=Event)
+def invalidate_family_stats(sender, instance: Event, **kwargs) -> None:
+    # Bumping before commit lets a concurrent read cache the old counts under
+    # the new version.
+    family_id = instance.family_id
+    transaction.on_commit(lambda: bump_stats_cache_version(family_id))
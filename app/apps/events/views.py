@@ -1,38 +1,44 @@
 from __future__ import annotations
 
 import calendar
+import hashlib
 from collections import defaultdict
-from datetime import UTC, date, datetime
-from zoneinfo import ZoneInfo
+from datetime import MAXYEAR, MINYEAR, UTC, date, datetime, time, timedelta
 
 from django.contrib import messages
 from django.contrib.auth.decorators import login_required
 from django.core.exceptions import ValidationError
-from django.core.paginator import Paginator
+from django.db.models.functions import TruncDate
+from django.middleware.csrf import get_token
 from django.shortcuts import redirect, render
 from django.utils import timezone
-from django.views.decorators.http import require_GET, require_http_methods, require_POST
+from django.views.decorators.cache import cache_control
+from django.views.decorators.http import etag, require_GET, require_http_methods, require_POST
 
+from apps.common.timezones import get_zone, is_valid_zone
 from apps.families.services import parse_uuid_or_none
 
 from .forms import EventForm
+from .models import Event
 from .services import (
     create_event_for_baby,
     delete_event,
+    encode_event_cursor,
     event_queryset_for_user,
+    events_after_cursor,
+    events_state_token,
     require_baby_access,
     require_event_access,
     update_event,
 )
 
+TIMELINE_EVENT_TYPES = tuple(Event.EventType.values)
+TIMELINE_PAGE_SIZE = 25
+
 
 def _safe_tz_name(raw: str | None, fallback: str = "UTC") -> str:
     candidate = raw or fallback
-    try:
-        ZoneInfo(candidate)
-        return candidate
-    except Exception:
-        return fallback
+    return candidate if is_valid_zone(candidate) else fallback
 
 
 def _safe_int(value: str | None, fallback: int) -> int:
@@ -42,6 +48,34 @@ def _safe_int(value: str | None, fallback: int) -> int:
         return fallback
 
 
+def _event_list_etag(request, queryset) -> str | None:
+    """
+    ETag for a page listing the events in ``queryset``.
+
+    Built from the count and latest ``updated_at`` of just the events the page
+    can show, so creates, edits and deletes among them change it. The user,
+    the query string, today's date and the CSRF secret are mixed in because
+    the page depends on them too. Pages with pending flash messages get no
+    ETag, so the messages are always rendered.
+    """
+    if len(messages.get_messages(request)):
+        return None
+    # get_token() creates the secret now if the request has none, so the page
+    # rendered below uses the same secret the ETag was built from.
+    get_token(request)
+    parts = (
+        str(request.user.pk),
+        events_state_token(queryset.select_related(None)),
+        request.GET.urlencode(),
+        # Pages without explicit year/month default to the current month.
+        timezone.localdate().isoformat(),
+        request.META["CSRF_COOKIE"],
+    )
+    return hashlib.md5("|".join(parts).encode(), usedforsecurity=False).hexdigest()
+
+
+# No ETag here, unlike the calendar: a state token over every matching event
+# would cost more than the keyset page itself.
 @login_required
 @require_GET
 def timeline_view(request):
@@ -55,26 +89,63 @@ def timeline_view(request):
     if event_type:
         queryset = queryset.filter(event_type=event_type)
 
-    paginator = Paginator(queryset, 25)
-    page = paginator.get_page(request.GET.get("page"))
+    # The timeline template reads only these columns; skip the detail joins.
+    queryset = (
+        queryset.select_related(None)
+        .select_related("baby")
+        .only("id", "event_type", "occurred_at_utc", "notes", "baby__name")
+    )
+
+    cursor = request.GET.get("cursor")
+    try:
+        queryset = events_after_cursor(queryset, cursor)
+    except ValueError:
+        cursor = None
+        queryset = events_after_cursor(queryset, None)
+
+    # One extra row tells whether an older page exists, without a COUNT.
+    events = list(queryset[: TIMELINE_PAGE_SIZE + 1])
+    next_query = ""
+    if len(events) > TIMELINE_PAGE_SIZE:
+        events = events[:TIMELINE_PAGE_SIZE]
+        params = request.GET.copy()
+        params["cursor"] = encode_event_cursor(events[-1].occurred_at_utc, events[-1].id)
+        next_query = params.urlencode()
+    first_query = ""
+    if cursor:
+        params = request.GET.copy()
+        params.pop("cursor")
+        first_query = params.urlencode()
 
     return render(
         request,
         "events/timeline.html",
         {
-            "page": page,
-            "event_types": [choice[0] for choice in page.object_list.model.EventType.choices],
+            "events": events,
+            "is_first_page": not cursor,
+            "first_query": first_query,
+            "next_query": next_query,
+            "event_types": TIMELINE_EVENT_TYPES,
             "active_event_type": event_type,
             "active_baby_id": str(baby_uuid) if baby_uuid else "",
         },
     )
 
 
-@login_required
-@require_GET
-def calendar_view(request):
+def _calendar_month(request):
+    """
+    Parse the calendar's query string.
+
+    Returns ``(tz_name, year, month, month_days, baby_uuid, queryset)`` where
+    ``queryset`` holds the user's events in that local month, optionally for
+    one baby.
+    """
     tz_name = _safe_tz_name(request.GET.get("timezone") or request.GET.get("tz"), fallback="UTC")
     year = _safe_int(request.GET.get("year"), timezone.localdate().year)
+    # The first and last supported years leave no room for the UTC offset or
+    # the next month's first day, which the bounds below need.
+    if not MINYEAR < year < MAXYEAR:
+        year = timezone.localdate().year
     month = _safe_int(request.GET.get("month"), timezone.localdate().month)
     if month < 1 or month > 12:
         month = timezone.localdate().month
@@ -84,17 +155,43 @@ def calendar_view(request):
     if baby_uuid:
         queryset = queryset.filter(baby_id=baby_uuid)
 
+    tz = get_zone(tz_name)
     _, month_days = calendar.monthrange(year, month)
-    start_local = datetime(year, month, 1, tzinfo=ZoneInfo(tz_name))
-    end_local = datetime(year, month, month_days, 23, 59, tzinfo=ZoneInfo(tz_name))
-    start_utc = start_local.astimezone(UTC)
-    end_utc = end_local.astimezone(UTC)
+    first_day = date(year, month, 1)
+    # Half-open [first day, first day of next month) in local time, converted once.
+    start_utc = datetime.combine(first_day, time.min, tzinfo=tz).astimezone(UTC)
+    end_utc = datetime.combine(
+        first_day + timedelta(days=month_days), time.min, tzinfo=tz
+    ).astimezone(UTC)
+    queryset = queryset.filter(occurred_at_utc__gte=start_utc, occurred_at_utc__lt=end_utc)
+    return tz_name, year, month, month_days, baby_uuid, queryset
+
+
+def _calendar_etag(request, *args, **kwargs) -> str | None:
+    if not request.user.is_authenticated:
+        return None
+    return _event_list_etag(request, _calendar_month(request)[-1])
 
-    events = queryset.filter(occurred_at_utc__gte=start_utc, occurred_at_utc__lte=end_utc)
+
+@login_required
+@require_GET
+@cache_control(private=True, no_cache=True)
+@etag(_calendar_etag)
+def calendar_view(request):
+    tz_name, year, month, month_days, baby_uuid, queryset = _calendar_month(request)
+    tz = get_zone(tz_name)
+
+    # The database returns each event's local day, so grouping needs no tz math.
+    # for_list() defers the detail relations, so only the baby join is kept.
+    events = (
+        queryset.select_related(None)
+        .select_related("baby")
+        .for_list()
+        .annotate(local_day=TruncDate("occurred_at_utc", tzinfo=tz))
+    )
     grouped = defaultdict(list)
     for event in events:
-        local_day = event.occurred_at_utc.astimezone(ZoneInfo(tz_name)).date()
-        grouped[local_day].append(event)
+        grouped[event.local_day].append(event)
 
     day_rows = []
     for day in range(1, month_days + 1):
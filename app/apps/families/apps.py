@@ -5,3 +5,6 @@ class FamiliesConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "apps.families"
     verbose_name = "Families"
+
+    def ready(self) -> None:
+        from . import signals  # noqa: F401
@@ -1,8 +1,10 @@
 from __future__ import annotations
 
+import re
 import uuid
 
 from django.core.exceptions import PermissionDenied
+from django.db.models import Exists, OuterRef
 
 from .models import Family, FamilyMembership
 
@@ -11,21 +13,65 @@ ALLOWED_WRITE_ROLES = {
     FamilyMembership.Role.CAREGIVER,
 }
 
+# Canonical hyphenated form, the only one the app emits in links and sessions.
+_UUID_RE = re.compile(
+    r"\A[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}\Z"
+)
+
+# Session key holding the ids (as strings) of families the user belongs to.
+MEMBER_FAMILY_IDS_SESSION_KEY = "member_family_ids"
+
 
 def user_families(user):
-    return Family.objects.filter(memberships__user=user).distinct()
+    is_member = FamilyMembership.objects.filter(family_id=OuterRef("pk"), user=user)
+    return Family.objects.filter(Exists(is_member))
+
+
+def remember_member_family_ids(session, user) -> list[str]:
+    """Load the user's family ids into ``session`` and return them."""
+    family_ids = [
+        str(family_id)
+        for family_id in FamilyMembership.objects.filter(user=user).values_list(
+            "family_id", flat=True
+        )
+    ]
+    session[MEMBER_FAMILY_IDS_SESSION_KEY] = family_ids
+    return family_ids
+
+
+def is_member_family_cached(request, family_id) -> bool:
+    """
+    Membership check against the session copy of the user's family ids.
+
+    A miss reloads the ids, so families joined since login are found. Hits can
+    be stale after a membership is removed; use this only for navigation state,
+    never for authorization.
+    """
+    family_id = str(family_id)
+    if family_id in request.session.get(MEMBER_FAMILY_IDS_SESSION_KEY, ()):
+        return True
+    return family_id in remember_member_family_ids(request.session, request.user)
 
 
 def parse_uuid_or_none(value):
     if not value:
         return None
-    try:
-        return uuid.UUID(str(value))
-    except (ValueError, TypeError, AttributeError):
+    if isinstance(value, uuid.UUID):
+        return value
+    text = value if isinstance(value, str) else str(value)
+    # Rejecting bad input up front avoids raising and catching in UUID().
+    if not _UUID_RE.match(text):
         return None
+    return uuid.UUID(text)
 
 
 def require_family_membership(user, family: Family) -> FamilyMembership:
+    """
+    Return the user's membership in ``family`` or raise PermissionDenied.
+
+    Every call queries the database, so a role change or removal applies to
+    the very next check, even on a user object that outlives one request.
+    """
     membership = FamilyMembership.objects.filter(user=user, family=family).first()
     if membership is None:
         raise PermissionDenied("You do not have access to this family.")
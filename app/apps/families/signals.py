@@ -0,0 +1,12 @@
+from __future__ import annotations
+
+from django.contrib.auth.signals import user_logged_in
+from django.dispatch import receiver
+
+from .services import remember_member_family_ids
+
+
+@receiver(user_logged_in)
+def cache_member_family_ids(sender, request, user, **kwargs) -> None:
+    if request is not None:
+        remember_member_family_ids(request.session, user)
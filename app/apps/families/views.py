@@ -6,7 +6,7 @@ from django.shortcuts import redirect, render
 from django.views.decorators.http import require_GET, require_http_methods
 
 from .models import Family, FamilyMembership
-from .services import parse_uuid_or_none
+from .services import is_member_family_cached, parse_uuid_or_none
 
 
 @login_required
@@ -37,7 +37,8 @@ def family_list_create_view(request):
 @require_GET
 def family_switch_view(request):
     family_uuid = parse_uuid_or_none(request.GET.get("family"))
-    if family_uuid and FamilyMembership.objects.filter(user=request.user, family_id=family_uuid).exists():
+    # Dashboard and baby views re-check active_family_id against the user's families.
+    if family_uuid and is_member_family_cached(request, family_uuid):
         request.session["active_family_id"] = str(family_uuid)
     else:
         request.session.pop("active_family_id", None)
@@ -3,7 +3,12 @@
 import os
 
 from django.core.asgi import get_asgi_application
+from django.urls import get_resolver
 
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "babybuddy.settings.production")
 
 application = get_asgi_application()
+
+# Import every view module and build the URL reverse map while the worker boots,
+# not during its first request.
+get_resolver().reverse_dict  # noqa: B018
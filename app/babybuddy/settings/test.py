@@ -0,0 +1,25 @@
+"""Test settings."""
+
+from .local import *  # noqa: F403
+
+DEBUG = False
+
+# Tests never exercise password strength; MD5 keeps create_user and login cheap.
+PASSWORD_HASHERS = ["django.contrib.auth.hashers.MD5PasswordHasher"]
+
+# Build the test database straight from the models instead of replaying every
+# migration. Only the accounts email expression index (a lookup optimization)
+# has no model-level equivalent.
+MIGRATION_MODULES = {
+    label: None
+    for label in (
+        "admin",
+        "auth",
+        "contenttypes",
+        "sessions",
+        "accounts",
+        "families",
+        "babies",
+        "events",
+    )
+}
@@ -5,16 +5,22 @@ import os
 import sys
 from pathlib import Path
 
+# Set once .env has been applied; child processes (the runserver autoreloader
+# re-executes this script) inherit the variables and skip reading it again.
+DOTENV_LOADED_FLAG = "BABYBUDDY_DOTENV_LOADED"
+
 
 def main() -> None:
-    root_env = Path(__file__).resolve().parent.parent / ".env"
-    if root_env.exists():
-        try:
-            from dotenv import load_dotenv
-
-            load_dotenv(root_env)
-        except Exception:
-            pass
+    if not os.environ.get(DOTENV_LOADED_FLAG):
+        root_env = Path(__file__).resolve().parent.parent / ".env"
+        if root_env.exists():
+            try:
+                from dotenv import load_dotenv
+
+                load_dotenv(root_env)
+            except Exception:
+                pass
+        os.environ[DOTENV_LOADED_FLAG] = "1"
     os.environ.setdefault("DJANGO_SETTINGS_MODULE", "babybuddy.settings.local")
     from django.core.management import execute_from_command_line
 
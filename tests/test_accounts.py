@@ -1,5 +1,12 @@
 from __future__ import annotations
 
+import json
+from datetime import datetime
+
+from apps.babies.models import Baby
+from apps.events.models import Event
+from apps.events.services import create_event_for_baby
+from apps.families.models import Family, FamilyMembership
 from django.contrib.auth import get_user_model
 from django.test import Client, TestCase
 from django.urls import reverse
@@ -52,10 +59,11 @@ class RegistrationFlowTests(TestCase):
 
     def test_register_rate_limited_after_repeated_posts(self):
         rate_limited_client = Client(HTTP_X_FORWARDED_FOR="203.0.113.10")
+        url = reverse("register")
         last_response = None
         for idx in range(21):
             last_response = rate_limited_client.post(
-                reverse("register"),
+                url,
                 {
                     "username": f"rluser{idx}",
                     "email": f"rluser{idx}@example.com",
@@ -66,3 +74,48 @@ class RegistrationFlowTests(TestCase):
 
         self.assertIsNotNone(last_response)
         self.assertEqual(last_response.status_code, 429)
+
+
+class AccountExportTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        User = get_user_model()
+        cls.user = User.objects.create_user("exporter", "exporter@example.com", "pass1234")
+        cls.family = Family.objects.create(name="Export Family", created_by=cls.user)
+        FamilyMembership.objects.create(
+            family=cls.family,
+            user=cls.user,
+            role=FamilyMembership.Role.OWNER,
+        )
+        cls.baby = Baby.objects.create(
+            family=cls.family,
+            name="Mia",
+            timezone="UTC",
+            created_by=cls.user,
+        )
+        for hour in (8, 9):
+            create_event_for_baby(
+                cls.user,
+                cls.baby,
+                {
+                    "event_type": Event.EventType.DIAPER,
+                    "occurred_at_local": datetime(2026, 2, 10, hour, 0),
+                    "timezone": "UTC",
+                    "details": {"diaper_type": "wet"},
+                },
+            )
+
+    def setUp(self):
+        self.client = Client()
+        self.client.login(username="exporter", password="pass1234")
+
+    def test_export_streams_families_and_events(self):
+        response = self.client.get(reverse("account_export"))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.streaming)
+        body = json.loads(b"".join(response.streaming_content))
+        self.assertEqual(body["user"]["username"], "exporter")
+        self.assertEqual([family["name"] for family in body["families"]], ["Export Family"])
+        self.assertEqual(len(body["events"]), 2)
+        self.assertEqual(body["events"][0]["details"]["diaper_type"], "wet")
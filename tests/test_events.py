@@ -1,31 +1,81 @@
 from __future__ import annotations
 
-from datetime import datetime
+import json
+import uuid
+from collections import defaultdict
+from datetime import UTC, datetime
 
+from apps.api.views import baby_events_view
 from apps.babies.models import Baby
-from apps.events.models import DiaperEvent, Event, IdempotencyRecord
-from apps.events.services import create_event_for_baby
+from apps.common.ids import uuid7
+from apps.events.forms import EventForm
+from apps.events.models import DiaperEvent, Event, FeedingEvent, IdempotencyRecord
+from apps.events.services import (
+    EVENT_VALUES_FIELDS,
+    create_event_for_baby,
+    event_detail_copy_fields,
+    event_queryset_for_user,
+    serialize_event,
+    serialize_event_values,
+    stats_cache_version,
+    update_event,
+)
 from apps.families.models import Family, FamilyMembership
 from django.contrib.auth import get_user_model
-from django.test import Client, TestCase
+from django.db import connection, transaction
+from django.test import Client, RequestFactory, SimpleTestCase, TestCase
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from django.utils import timezone
 
 
+def make_events(user, baby, specs):
+    """
+    Bulk-insert fixture events as (event_type, occurred_at_utc, detail_model, details).
+
+    Skips the service layer (idempotency, stats cache bumps), so use it only for
+    rows a test reads back.
+    """
+    with transaction.atomic():
+        events = Event.objects.bulk_create(
+            [
+                Event(
+                    family_id=baby.family_id,
+                    baby=baby,
+                    event_type=event_type,
+                    occurred_at_utc=occurred_at_utc,
+                    timezone=baby.timezone,
+                    created_by=user,
+                )
+                for event_type, occurred_at_utc, _, _ in specs
+            ]
+        )
+        details_by_model = defaultdict(list)
+        for event, (_, _, detail_model, details) in zip(events, specs, strict=True):
+            details_by_model[detail_model].append(
+                detail_model(event=event, **event_detail_copy_fields(event), **details)
+            )
+        for detail_model, rows in details_by_model.items():
+            detail_model.objects.bulk_create(rows)
+    return events
+
+
 class EventServiceTests(TestCase):
-    def setUp(self):
-        self.user = get_user_model().objects.create_user("caregiver", "caregiver@example.com", "pass1234")
-        self.family = Family.objects.create(name="A Family", created_by=self.user)
+    @classmethod
+    def setUpTestData(cls):
+        User = get_user_model()
+        cls.user = User.objects.create_user("caregiver", "caregiver@example.com", "pass1234")
+        cls.family = Family.objects.create(name="A Family", created_by=cls.user)
         FamilyMembership.objects.create(
-            family=self.family,
-            user=self.user,
+            family=cls.family,
+            user=cls.user,
             role=FamilyMembership.Role.OWNER,
         )
-        self.baby = Baby.objects.create(
-            family=self.family,
+        cls.baby = Baby.objects.create(
+            family=cls.family,
             name="Ava",
             timezone="UTC",
-            created_by=self.user,
+            created_by=cls.user,
         )
 
     def test_create_diaper_event_creates_core_and_detail(self):
@@ -39,43 +89,148 @@ class EventServiceTests(TestCase):
 
         event = create_event_for_baby(self.user, self.baby, payload)
 
-        self.assertEqual(Event.objects.count(), 1)
-        self.assertEqual(event.family, self.family)
-        self.assertEqual(event.baby, self.baby)
-        self.assertEqual(event.event_type, Event.EventType.DIAPER)
+        # One joined query reads back both the event and its detail row.
+        stored = list(Event.objects.select_related("diaper_detail"))
+        self.assertEqual(len(stored), 1)
+        self.assertEqual(stored[0].pk, event.pk)
+        self.assertEqual(stored[0].family_id, self.family.id)
+        self.assertEqual(stored[0].baby_id, self.baby.id)
+        self.assertEqual(stored[0].event_type, Event.EventType.DIAPER)
 
-        detail = DiaperEvent.objects.get(event=event)
+        detail = stored[0].diaper_detail
         self.assertEqual(detail.diaper_type, "wet")
         self.assertEqual(detail.color, "yellow")
+        self.assertEqual(detail.family_id, event.family_id)
+        self.assertEqual(detail.occurred_at_utc, event.occurred_at_utc)
+
+    def test_update_event_replaces_detail_of_previous_type(self):
+        event = create_event_for_baby(
+            self.user,
+            self.baby,
+            {
+                "event_type": Event.EventType.FEEDING,
+                "occurred_at_local": datetime(2026, 2, 15, 9, 0),
+                "timezone": "UTC",
+                "details": {"method": "bottle", "amount_ml": 90},
+            },
+        )
+
+        update_event(
+            self.user,
+            event,
+            {
+                "event_type": Event.EventType.DIAPER,
+                "occurred_at_local": datetime(2026, 2, 15, 9, 5),
+                "timezone": "UTC",
+                "details": {"diaper_type": "wet"},
+            },
+        )
+
+        self.assertFalse(FeedingEvent.objects.filter(event=event).exists())
+        self.assertEqual(DiaperEvent.objects.get(event=event).diaper_type, "wet")
+
+    def test_serialize_event_values_matches_serialize_event(self):
+        for event_type, details in (
+            (Event.EventType.FEEDING, {"method": "bottle", "amount_ml": 120}),
+            (Event.EventType.DIAPER, {"diaper_type": "dirty", "color": "brown"}),
+            (
+                Event.EventType.SLEEP,
+                {"sleep_end_local": datetime(2026, 2, 15, 12, 0), "quality": "good"},
+            ),
+            (Event.EventType.PUMPING, {"amount_ml": 60, "side": "left"}),
+        ):
+            create_event_for_baby(
+                self.user,
+                self.baby,
+                {
+                    "event_type": event_type,
+                    "occurred_at_local": datetime(2026, 2, 15, 11, 0),
+                    "timezone": "UTC",
+                    "details": details,
+                },
+            )
+
+        events = event_queryset_for_user(self.user)
+        expected = {event.id: serialize_event(event) for event in events}
+        rows = Event.objects.values(*EVENT_VALUES_FIELDS)
+        self.assertEqual({row["id"]: serialize_event_values(row) for row in rows}, expected)
+        self.assertEqual(len(expected), 4)
+
+
+class EventIdTests(SimpleTestCase):
+    def test_uuid7_is_version_7_and_time_ordered(self):
+        first = uuid7()
+        later = uuid7()
+        self.assertEqual(first.version, 7)
+        self.assertEqual(first.variant, uuid.RFC_4122)
+        # The leading 48 bits are the millisecond timestamp.
+        self.assertLessEqual(first.bytes[:6], later.bytes[:6])
+
+
+class EventFormBulkCleanTests(SimpleTestCase):
+    def test_bulk_clean_matches_form_payloads_and_collects_errors(self):
+        submissions = [
+            {
+                "event_type": "feeding",
+                "occurred_at_local": "2026-02-15T10:30",
+                "timezone": "UTC",
+                "feeding_method": "bottle",
+                "feeding_amount_ml": "90",
+            },
+            {
+                "event_type": "sleep",
+                "occurred_at_local": "2026-02-15T13:00",
+                "timezone": "UTC",
+                "sleep_end_local": "2026-02-15T14:15",
+                "notes": " nap ",
+            },
+            {"event_type": "diaper", "occurred_at_local": "2026-02-15T11:00", "timezone": "UTC"},
+            {"event_type": "bath", "occurred_at_local": "not a date", "timezone": "UTC"},
+        ]
+
+        valid, errors = EventForm.bulk_clean(submissions)
+
+        expected = []
+        for data in submissions[:2]:
+            form = EventForm(data)
+            self.assertTrue(form.is_valid(), form.errors)
+            expected.append(form.to_payload())
+        self.assertEqual(valid, expected)
+
+        self.assertEqual([index for index, _ in errors], [2, 3])
+        self.assertEqual(set(errors[0][1]), set(EventForm(submissions[2]).errors))
+        self.assertEqual(set(errors[1][1]), {"event_type", "occurred_at_local"})
 
 
 class EventPermissionTests(TestCase):
-    def setUp(self):
+    @classmethod
+    def setUpTestData(cls):
         User = get_user_model()
-        self.owner = User.objects.create_user("owner", "owner@example.com", "pass1234")
-        self.other = User.objects.create_user("other", "other@example.com", "pass1234")
+        cls.owner = User.objects.create_user("owner", "owner@example.com", "pass1234")
+        cls.other = User.objects.create_user("other", "other@example.com", "pass1234")
 
-        self.family = Family.objects.create(name="Family One", created_by=self.owner)
+        cls.family = Family.objects.create(name="Family One", created_by=cls.owner)
         FamilyMembership.objects.create(
-            family=self.family,
-            user=self.owner,
+            family=cls.family,
+            user=cls.owner,
             role=FamilyMembership.Role.OWNER,
         )
 
-        self.other_family = Family.objects.create(name="Family Two", created_by=self.other)
+        cls.other_family = Family.objects.create(name="Family Two", created_by=cls.other)
         FamilyMembership.objects.create(
-            family=self.other_family,
-            user=self.other,
+            family=cls.other_family,
+            user=cls.other,
             role=FamilyMembership.Role.OWNER,
         )
 
-        self.baby = Baby.objects.create(
-            family=self.family,
+        cls.baby = Baby.objects.create(
+            family=cls.family,
             name="June",
             timezone="UTC",
-            created_by=self.owner,
+            created_by=cls.owner,
         )
 
+    def setUp(self):
         self.client = Client()
 
     def test_user_cannot_query_other_family_baby_events(self):
@@ -83,50 +238,120 @@ class EventPermissionTests(TestCase):
         response = self.client.get(reverse("api_baby_events", kwargs={"baby_id": self.baby.id}))
         self.assertEqual(response.status_code, 403)
 
+    def test_calendar_revalidates_with_etag(self):
+        self.client.login(username="owner", password="pass1234")
+        # The calendar's ETag covers only the month it shows.
+        url = reverse("calendar")
+        params = {"year": 2026, "month": 2}
+        first = self.client.get(url, params)
+        self.assertEqual(first.status_code, 200)
+        etag = first["ETag"]
+
+        cached = self.client.get(url, params, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(cached.status_code, 304)
+
+        event = create_event_for_baby(
+            self.owner,
+            self.baby,
+            {
+                "event_type": Event.EventType.DIAPER,
+                "occurred_at_local": datetime(2026, 2, 15, 10, 30),
+                "timezone": "UTC",
+                "notes": "",
+                "details": {"diaper_type": "wet", "color": "yellow", "consistency": "thin"},
+            },
+        )
+        changed = self.client.get(url, params, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(changed.status_code, 200)
+
+        event.delete()
+        refreshed = self.client.get(url, params, HTTP_IF_NONE_MATCH=changed["ETag"])
+        self.assertEqual(refreshed.status_code, 200)
+
+    def test_calendar_ignores_out_of_range_years(self):
+        self.client.login(username="owner", password="pass1234")
+        for year in ("1", "9999", "10000"):
+            response = self.client.get(reverse("calendar"), {"year": year, "month": 12})
+            self.assertEqual(response.status_code, 200)
+
+    def test_timeline_pages_by_cursor(self):
+        for minute in range(26):
+            create_event_for_baby(
+                self.owner,
+                self.baby,
+                {
+                    "event_type": Event.EventType.DIAPER,
+                    "occurred_at_local": datetime(2026, 2, 15, 10, minute),
+                    "timezone": "UTC",
+                    "notes": "",
+                    "details": {"diaper_type": "wet"},
+                },
+            )
+        self.client.login(username="owner", password="pass1234")
+
+        first = self.client.get(reverse("timeline"), {"type": "diaper"})
+        self.assertEqual(len(first.context["events"]), 25)
+        self.assertIn("type=diaper", first.context["next_query"])
+
+        second = self.client.get(f"{reverse('timeline')}?{first.context['next_query']}")
+        self.assertEqual(len(second.context["events"]), 1)
+        self.assertEqual(second.context["events"][0].occurred_at_utc.minute, 0)
+        self.assertEqual(second.context["next_query"], "")
+
+        bad_cursor = self.client.get(reverse("timeline"), {"cursor": "not-a-cursor"})
+        self.assertEqual(len(bad_cursor.context["events"]), 25)
+
 
 class SummaryApiTests(TestCase):
-    def setUp(self):
+    @classmethod
+    def setUpTestData(cls):
         User = get_user_model()
-        self.user = User.objects.create_user("summary", "summary@example.com", "pass1234")
+        cls.user = User.objects.create_user("summary", "summary@example.com", "pass1234")
 
-        self.family = Family.objects.create(name="Summary Family", created_by=self.user)
+        cls.family = Family.objects.create(name="Summary Family", created_by=cls.user)
         FamilyMembership.objects.create(
-            family=self.family,
-            user=self.user,
+            family=cls.family,
+            user=cls.user,
             role=FamilyMembership.Role.OWNER,
         )
 
-        self.baby = Baby.objects.create(
-            family=self.family,
+        cls.baby = Baby.objects.create(
+            family=cls.family,
             name="Noah",
             timezone="UTC",
-            created_by=self.user,
+            created_by=cls.user,
         )
 
-        create_event_for_baby(
-            self.user,
-            self.baby,
-            {
-                "event_type": Event.EventType.FEEDING,
-                "occurred_at_local": timezone.datetime(2026, 2, 10, 8, 0),
-                "timezone": "UTC",
-                "details": {"method": "bottle", "amount_ml": 120},
-            },
-        )
-        create_event_for_baby(
-            self.user,
-            self.baby,
-            {
-                "event_type": Event.EventType.DIAPER,
-                "occurred_at_local": timezone.datetime(2026, 2, 10, 9, 0),
-                "timezone": "UTC",
-                "details": {"diaper_type": "wet"},
-            },
+        make_events(
+            cls.user,
+            cls.baby,
+            [
+                (
+                    Event.EventType.FEEDING,
+                    datetime(2026, 2, 10, 8, 0, tzinfo=UTC),
+                    FeedingEvent,
+                    {"method": "bottle", "amount_ml": 120},
+                ),
+                (
+                    Event.EventType.DIAPER,
+                    datetime(2026, 2, 10, 9, 0, tzinfo=UTC),
+                    DiaperEvent,
+                    {"diaper_type": "wet"},
+                ),
+            ],
         )
 
+    def setUp(self):
         self.client = Client()
         self.client.login(username="summary", password="pass1234")
 
+    def _post_events(self, payload, **extra):
+        """POST JSON straight to baby_events_view, skipping the middleware stack."""
+        url = reverse("api_baby_events", kwargs={"baby_id": self.baby.id})
+        request = RequestFactory().post(url, data=payload, content_type="application/json", **extra)
+        request.user = self.user
+        return baby_events_view(request, baby_id=self.baby.id)
+
     def test_daily_summary_endpoint(self):
         response = self.client.get(
             reverse("api_daily_summary", kwargs={"baby_id": self.baby.id}),
@@ -139,6 +364,153 @@ class SummaryApiTests(TestCase):
         self.assertEqual(body["by_type"]["feeding"], 1)
         self.assertEqual(body["by_type"]["diaper"], 1)
 
+    def test_summaries_aggregate_in_one_grouped_query(self):
+        for name, params in (
+            ("api_daily_summary", {"date": "2026-02-10"}),
+            ("api_range_summary", {"from": "2026-02-01", "to": "2026-02-28"}),
+            ("api_range_summary", {"from": "2026-02-01", "to": "2026-02-28", "by_day": "1"}),
+        ):
+            with CaptureQueriesContext(connection) as captured:
+                response = self.client.get(reverse(name, kwargs={"baby_id": self.baby.id}), params)
+
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(response.json()["total"], 2)
+            # Besides the ETag's ungrouped COUNT/MAX, exactly one grouped query.
+            event_queries = [q["sql"] for q in captured if "events_event" in q["sql"]]
+            self.assertEqual(len(event_queries), 2)
+            self.assertEqual(sum("GROUP BY" in sql for sql in event_queries), 1)
+
+    def test_summaries_revalidate_with_etag(self):
+        for name, params in (
+            ("api_daily_summary", {"date": "2026-02-10"}),
+            ("api_range_summary", {"from": "2026-02-01", "to": "2026-02-28"}),
+        ):
+            url = reverse(name, kwargs={"baby_id": self.baby.id})
+            first = self.client.get(url, params)
+            self.assertEqual(first.status_code, 200)
+
+            cached = self.client.get(url, params, HTTP_IF_NONE_MATCH=first["ETag"])
+            self.assertEqual(cached.status_code, 304)
+
+            other_zone = self.client.get(url, {**params, "timezone": "Asia/Tokyo"})
+            self.assertNotEqual(other_zone["ETag"], first["ETag"])
+
+        url = reverse("api_daily_summary", kwargs={"baby_id": self.baby.id})
+        etag = self.client.get(url, {"date": "2026-02-10"})["ETag"]
+        make_events(
+            self.user,
+            self.baby,
+            [
+                (
+                    Event.EventType.DIAPER,
+                    datetime(2026, 2, 11, 9, 0, tzinfo=UTC),
+                    DiaperEvent,
+                    {"diaper_type": "wet"},
+                )
+            ],
+        )
+        outside = self.client.get(url, {"date": "2026-02-10"}, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(outside.status_code, 304)
+        Event.objects.filter(baby=self.baby, event_type=Event.EventType.DIAPER).delete()
+        changed = self.client.get(url, {"date": "2026-02-10"}, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(changed.status_code, 200)
+        self.assertEqual(changed.json()["total"], 1)
+
+        outsider = get_user_model().objects.create_user(
+            "outsider", "outsider@example.com", "pass1234"
+        )
+        self.client.force_login(outsider)
+        refused = self.client.get(url, {"date": "2026-02-10"}, HTTP_IF_NONE_MATCH=changed["ETag"])
+        self.assertEqual(refused.status_code, 403)
+
+    def test_range_summary_by_day(self):
+        response = self.client.get(
+            reverse("api_range_summary", kwargs={"baby_id": self.baby.id}),
+            {"from": "2026-02-09", "to": "2026-02-11", "by_day": "1"},
+        )
+
+        self.assertEqual(response.status_code, 200)
+        body = response.json()
+        self.assertEqual(body["by_type"], {"feeding": 1, "diaper": 1})
+        self.assertEqual(
+            body["by_day"],
+            [
+                {"date": "2026-02-09", "total": 0, "by_type": {}},
+                {"date": "2026-02-10", "total": 2, "by_type": {"feeding": 1, "diaper": 1}},
+                {"date": "2026-02-11", "total": 0, "by_type": {}},
+            ],
+        )
+
+        too_long = self.client.get(
+            reverse("api_range_summary", kwargs={"baby_id": self.baby.id}),
+            {"from": "0001-01-01", "to": "9999-12-31", "by_day": "1"},
+        )
+        self.assertEqual(too_long.status_code, 400)
+
+    def test_list_events_paginates_with_cursor(self):
+        url = reverse("api_baby_events", kwargs={"baby_id": self.baby.id})
+
+        first = self.client.get(url, {"limit": 1}).json()
+        self.assertEqual(len(first["results"]), 1)
+        self.assertEqual(first["results"][0]["event_type"], "diaper")
+        self.assertTrue(first["pagination"]["has_more"])
+        self.assertNotIn("total", first["pagination"])
+
+        cursor = first["pagination"]["next_cursor"]
+        second = self.client.get(url, {"limit": 1, "cursor": cursor}).json()
+        self.assertEqual(len(second["results"]), 1)
+        self.assertEqual(second["results"][0]["event_type"], "feeding")
+        self.assertFalse(second["pagination"]["has_more"])
+        self.assertIsNone(second["pagination"]["next_cursor"])
+
+    def test_list_events_offset_mode_skips_count_on_last_page(self):
+        url = reverse("api_baby_events", kwargs={"baby_id": self.baby.id})
+        with CaptureQueriesContext(connection) as captured:
+            body = self.client.get(url, {"count": "1", "limit": 5}).json()
+
+        self.assertEqual(body["pagination"]["total"], 2)
+        self.assertFalse(body["pagination"]["total_is_estimate"])
+        self.assertFalse(any("COUNT(" in q["sql"].upper() for q in captured))
+
+    def test_list_events_query_count_does_not_grow_with_rows(self):
+        url = reverse("api_baby_events", kwargs={"baby_id": self.baby.id})
+        with CaptureQueriesContext(connection) as few:
+            self.client.get(url)
+
+        for hour, event_type, details in (
+            (10, Event.EventType.SLEEP, {"quality": "good"}),
+            (11, Event.EventType.PUMPING, {"amount_ml": 60}),
+            (12, Event.EventType.FEEDING, {"method": "breast", "side": "left"}),
+        ):
+            create_event_for_baby(
+                self.user,
+                self.baby,
+                {
+                    "event_type": event_type,
+                    "occurred_at_local": timezone.datetime(2026, 2, 10, hour, 0),
+                    "timezone": "UTC",
+                    "details": details,
+                },
+            )
+
+        with CaptureQueriesContext(connection) as many:
+            body = self.client.get(url).json()
+
+        self.assertEqual(len(body["results"]), 5)
+        self.assertEqual(body["results"][1]["details"]["amount_ml"], 60)
+        self.assertEqual(len(many), len(few))
+
+    def test_list_events_rejects_invalid_cursor(self):
+        url = reverse("api_baby_events", kwargs={"baby_id": self.baby.id})
+        response = self.client.get(url, {"cursor": "not-a-cursor"})
+        self.assertEqual(response.status_code, 400)
+
+    def test_list_events_offset_mode_reports_total(self):
+        url = reverse("api_baby_events", kwargs={"baby_id": self.baby.id})
+        body = self.client.get(url, {"count": "1", "limit": 1}).json()
+        self.assertEqual(body["pagination"]["total"], 2)
+        self.assertTrue(body["pagination"]["has_more"])
+
     def test_post_events_respects_idempotency_key(self):
         payload = {
             "event_type": "feeding",
@@ -146,24 +518,12 @@ class SummaryApiTests(TestCase):
             "timezone": "UTC",
             "details": {"method": "bottle", "amount_ml": 90},
         }
-        url = reverse("api_baby_events", kwargs={"baby_id": self.baby.id})
-
-        first = self.client.post(
-            url,
-            data=payload,
-            content_type="application/json",
-            headers={"Idempotency-Key": "same-key"},
-        )
-        second = self.client.post(
-            url,
-            data=payload,
-            content_type="application/json",
-            headers={"Idempotency-Key": "same-key"},
-        )
+        first = self._post_events(payload, headers={"Idempotency-Key": "same-key"})
+        second = self._post_events(payload, headers={"Idempotency-Key": "same-key"})
 
         self.assertEqual(first.status_code, 201)
         self.assertEqual(second.status_code, 201)
-        self.assertEqual(first.json()["id"], second.json()["id"])
+        self.assertEqual(json.loads(first.content)["id"], json.loads(second.content)["id"])
         self.assertEqual(IdempotencyRecord.objects.filter(user=self.user, key="same-key").count(), 1)
 
     def test_post_events_returns_sanitized_error_message(self):
@@ -173,13 +533,66 @@ class SummaryApiTests(TestCase):
             "timezone": "Invalid/Timezone",
             "details": {"method": "bottle", "amount_ml": 90},
         }
-        url = reverse("api_baby_events", kwargs={"baby_id": self.baby.id})
+        response = self._post_events(payload)
 
-        response = self.client.post(
-            url,
-            data=payload,
-            content_type="application/json",
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(json.loads(response.content)["error"], "Invalid request payload.")
+
+
+class DashboardStatsTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        User = get_user_model()
+        cls.user = User.objects.create_user("dash", "dash@example.com", "pass1234")
+        cls.family = Family.objects.create(name="Dash Family", created_by=cls.user)
+        FamilyMembership.objects.create(
+            family=cls.family,
+            user=cls.user,
+            role=FamilyMembership.Role.OWNER,
+        )
+        cls.baby = Baby.objects.create(
+            family=cls.family,
+            name="Leo",
+            timezone="UTC",
+            created_by=cls.user,
         )
 
-        self.assertEqual(response.status_code, 400)
-        self.assertEqual(response.json()["error"], "Invalid request payload.")
+    def setUp(self):
+        self.client = Client()
+        self.client.login(username="dash", password="pass1234")
+
+    def test_cached_stats_refresh_after_new_event(self):
+        before = self.client.get(reverse("dashboard"))
+        self.assertEqual(before.context["stats"]["last_24h"], 0)
+
+        create_event_for_baby(
+            self.user,
+            self.baby,
+            {
+                "event_type": Event.EventType.FEEDING,
+                "occurred_at_local": timezone.now(),
+                "timezone": "UTC",
+                "details": {"method": "bottle"},
+            },
+        )
+
+        after = self.client.get(reverse("dashboard"))
+        self.assertEqual(after.context["stats"]["last_24h"], 1)
+        self.assertEqual(after.context["stats"]["feeding"], 1)
+        self.assertEqual(after.context["stats"]["last_7d"], 1)
+
+    def test_stats_version_bumps_only_after_commit(self):
+        payload = {
+            "event_type": Event.EventType.FEEDING,
+            "occurred_at_local": timezone.now(),
+            "timezone": "UTC",
+            "details": {"method": "bottle"},
+        }
+        for idempotency_key in (None, "after-commit"):
+            before = stats_cache_version(self.family.id)
+            with self.captureOnCommitCallbacks(execute=True):
+                create_event_for_baby(
+                    self.user, self.baby, dict(payload), idempotency_key=idempotency_key
+                )
+                self.assertEqual(stats_cache_version(self.family.id), before)
+            self.assertGreater(stats_cache_version(self.family.id), before)
@@ -1,11 +1,31 @@
 """
 End-to-end smoke tests using Playwright.
 
-These tests verify critical user flows work correctly.
+These tests verify critical user flows work correctly. They run with
+pytest-django's live_server, which serves the app in-process against the test
+database, so no separately started runserver is needed.
 """
+import os
 import re
 import time
-from playwright.sync_api import Page, expect
+
+import pytest
+from playwright.sync_api import Browser, BrowserContext, Page, expect
+
+# Playwright's sync API keeps an event loop running in the test thread; allow
+# pytest-django's database setup and teardown to run alongside it.
+os.environ.setdefault("DJANGO_ALLOW_ASYNC_UNSAFE", "true")
+
+
+# Paths the smoke tests visit, relative to the live server's base_url.
+HOME_PATH = "/"
+LOGIN_PATH = "/accounts/login/"
+REGISTER_PATH = "/accounts/register/"
+FAMILIES_PATH = "/families/"
+BABIES_PATH = "/babies/"
+HEALTH_PATH = "/healthz"
+MANIFEST_PATH = "/manifest.json"
+SERVICE_WORKER_PATH = "/sw.js"
 
 
 def get_unique_username(prefix="testuser"):
@@ -13,24 +33,71 @@ def get_unique_username(prefix="testuser"):
     return f"{prefix}_{int(time.time() * 1000)}"
 
 
-def test_homepage_redirects_to_login(page: Page):
+def register_via_request(context: BrowserContext, prefix: str, password: str) -> str:
+    """
+    Register a new user over HTTP and leave ``context`` logged in as them.
+
+    Posts the registration form through the context's request client, which
+    shares its cookie jar, so no page is rendered. Use it when registration is
+    setup rather than the thing under test.
+    """
+    # The GET sets the csrftoken cookie; its value is accepted as the form token.
+    context.request.get(REGISTER_PATH)
+    csrf_token = next(
+        cookie["value"] for cookie in context.cookies() if cookie["name"] == "csrftoken"
+    )
+    username = get_unique_username(prefix)
+    response = context.request.post(
+        REGISTER_PATH,
+        form={
+            "csrfmiddlewaretoken": csrf_token,
+            "username": username,
+            "email": f"{username}@example.com",
+            "password1": password,
+            "password2": password,
+        },
+    )
+    assert response.ok, f"Registration failed with status {response.status}"
+    return username
+
+
+@pytest.fixture(scope="session")
+def base_url(live_server):
+    """Point Playwright's relative URLs at the in-process live server."""
+    return live_server.url
+
+
+@pytest.fixture(scope="module")
+def anonymous_page(browser: Browser, base_url):
+    """
+    One page shared by the tests that only read anonymous pages.
+
+    pytest-playwright already reuses the browser across the session but opens a
+    new context per test; these tests never log in, so they can share one.
+    """
+    context = browser.new_context(base_url=base_url)
+    yield context.new_page()
+    context.close()
+
+
+def test_homepage_redirects_to_login(anonymous_page: Page):
     """Verify homepage redirects unauthenticated users to login."""
-    page.goto("http://127.0.0.1:8000/")
-    expect(page).to_have_url(re.compile(r".*/accounts/login/.*"))
-    expect(page.locator("h1")).to_contain_text("Login")
+    anonymous_page.goto(HOME_PATH)
+    expect(anonymous_page).to_have_url(re.compile(r".*/accounts/login/.*"))
+    expect(anonymous_page.locator("h1")).to_contain_text("Login")
 
 
-def test_register_page_loads(page: Page):
+def test_register_page_loads(anonymous_page: Page):
     """Verify registration page loads correctly."""
-    page.goto("http://127.0.0.1:8000/accounts/register/")
-    expect(page.locator("h1")).to_contain_text("Create Account")
+    anonymous_page.goto(REGISTER_PATH)
+    expect(anonymous_page.locator("h1")).to_contain_text("Create Account")
 
     # Check form fields are present
-    expect(page.locator('input[name="username"]')).to_be_visible()
-    expect(page.locator('input[name="email"]')).to_be_visible()
-    expect(page.locator('input[name="password1"]')).to_be_visible()
-    expect(page.locator('input[name="password2"]')).to_be_visible()
-    expect(page.locator('button[type="submit"]')).to_be_visible()
+    expect(anonymous_page.locator('input[name="username"]')).to_be_visible()
+    expect(anonymous_page.locator('input[name="email"]')).to_be_visible()
+    expect(anonymous_page.locator('input[name="password1"]')).to_be_visible()
+    expect(anonymous_page.locator('input[name="password2"]')).to_be_visible()
+    expect(anonymous_page.locator('button[type="submit"]')).to_be_visible()
 
 
 def test_user_registration_and_login_flow(page: Page):
@@ -40,7 +107,7 @@ def test_user_registration_and_login_flow(page: Page):
     This is the most critical smoke test for the application.
     """
     # Register a new user
-    page.goto("http://127.0.0.1:8000/accounts/register/")
+    page.goto(REGISTER_PATH)
 
     username = get_unique_username("smoketest")
     email = f"{username}@example.com"
@@ -53,10 +120,10 @@ def test_user_registration_and_login_flow(page: Page):
     page.click('button[type="submit"]')
 
     # Should redirect to home after successful registration
-    expect(page).to_have_url("http://127.0.0.1:8000/", timeout=10000)
+    expect(page).to_have_url(HOME_PATH, timeout=10000)
 
     # Verify home page loads - user is now logged in
-    page.wait_for_load_state("networkidle")
+    expect(page.locator("h1")).to_contain_text("Dashboard")
 
     # Verify we're authenticated by checking we're NOT on login page
     current_url = page.url
@@ -65,76 +132,63 @@ def test_user_registration_and_login_flow(page: Page):
     # Test successful - user can register and is automatically logged in
 
 
-def test_create_family_and_baby_flow(page: Page):
+def test_create_family_and_baby_flow(page: Page, base_url: str):
     """
     Test creating a family and baby.
 
     This verifies the core data model works end-to-end.
     """
-    # First register and login
-    page.goto("http://127.0.0.1:8000/accounts/register/")
-
-    username = get_unique_username("familytest")
-    email = f"{username}@example.com"
-    password = "SecurePass456!"
-
-    page.fill('input[name="username"]', username)
-    page.fill('input[name="email"]', email)
-    page.fill('input[name="password1"]', password)
-    page.fill('input[name="password2"]', password)
-    page.click('button[type="submit"]')
-
-    expect(page).to_have_url("http://127.0.0.1:8000/", timeout=10000)
-    page.wait_for_load_state("networkidle")
+    # Registration has its own test; sign up over HTTP and go straight to the flow.
+    register_via_request(page.context, "familytest", "SecurePass456!")
 
     # Navigate to families page
-    page.goto("http://127.0.0.1:8000/families/")
-    page.wait_for_load_state("networkidle")
+    page.goto(FAMILIES_PATH)
+    expect(page.get_by_role("heading", name="Create Family")).to_be_visible()
 
     # Create a new family - check if form exists
     family_name_input = page.locator('input[name="name"]')
     if family_name_input.is_visible():
         family_name_input.fill("Test Family")
         page.click('button[type="submit"]')
-        page.wait_for_load_state("networkidle")
+        expect(page.locator("body")).to_contain_text("Test Family")
 
         # Verify we're still on families page or redirected properly
-        assert "/families" in page.url or page.url == "http://127.0.0.1:8000/"
+        assert "/families" in page.url or page.url == f"{base_url}{HOME_PATH}"
 
     # Navigate to babies page
-    page.goto("http://127.0.0.1:8000/babies/")
-    page.wait_for_load_state("networkidle")
+    page.goto(BABIES_PATH)
+    expect(page.get_by_role("heading", name="Add Baby")).to_be_visible()
 
     # Verify babies page loads (may need family selection first)
-    assert page.url == "http://127.0.0.1:8000/babies/" or "/babies" in page.url
+    assert page.url == f"{base_url}{BABIES_PATH}" or "/babies" in page.url
 
 
-def test_api_health_endpoint(page: Page):
+def test_api_health_endpoint(anonymous_page: Page):
     """Verify the health check endpoint works."""
-    response = page.goto("http://127.0.0.1:8000/healthz")
+    response = anonymous_page.goto(HEALTH_PATH)
     assert response.status == 200
     assert response.json() == {"status": "ok"}
 
 
-def test_pwa_manifest_loads(page: Page):
+def test_pwa_manifest_loads(anonymous_page: Page):
     """Verify PWA manifest is accessible."""
     # Check if manifest endpoint exists, skip if 404
-    response = page.goto("http://127.0.0.1:8000/manifest.json")
+    response = anonymous_page.goto(MANIFEST_PATH)
 
     if response.status == 404:
         # Manifest might be at a different path or not yet implemented
         # Check the actual PWA manifest path from views
-        response = page.goto("http://127.0.0.1:8000/app-manifest.json")
+        response = anonymous_page.goto("/app-manifest.json")
 
     # If still 404, PWA manifest may not be implemented yet
     # This is a soft requirement for MVP
     assert response.status in [200, 404]
 
 
-def test_service_worker_loads(page: Page):
+def test_service_worker_loads(anonymous_page: Page):
     """Verify service worker script is accessible."""
     # Check if service worker endpoint exists, skip if 404
-    response = page.goto("http://127.0.0.1:8000/sw.js")
+    response = anonymous_page.goto(SERVICE_WORKER_PATH)
 
     # If 404, PWA service worker may not be implemented yet
     # This is a soft requirement for MVP
@@ -147,32 +201,32 @@ def test_login_rate_limiting(page: Page):
 
     Note: This test will make many failed login attempts.
     """
-    page.goto("http://127.0.0.1:8000/accounts/login/")
-
-    # Attempt 35 failed logins (limit is 30 per 15 minutes)
-    for i in range(35):
-        page.fill('input[name="username"]', f"baduser{i}")
-        page.fill('input[name="password"]', "wrongpassword")
-        page.click('button[type="submit"]')
-        page.wait_for_load_state("networkidle")
-
-        # After 30 attempts, we should get rate limited
-        if i >= 30:
-            # Check if we got a 429 or error message
-            # The exact implementation may vary
-            page_content = page.content()
-            if "rate limit" in page_content.lower() or "too many" in page_content.lower():
-                # Rate limiting is working
-                return
-
-    # If we got here without hitting rate limit, that might be okay
-    # depending on implementation details
-    print("Warning: Did not detect rate limiting after 35 attempts")
-
-
-def test_security_headers_present(page: Page):
+    page.goto(LOGIN_PATH)
+    csrf_token = page.locator('input[name="csrfmiddlewaretoken"]').input_value()
+
+    # Post straight over HTTP (sharing the page's cookies) instead of filling and
+    # rendering the form each time, and stop at the first 429. The limit is 30
+    # POSTs per 15 minutes, so the 31st attempt must be rejected.
+    status = None
+    for i in range(31):
+        response = page.request.post(
+            LOGIN_PATH,
+            form={
+                "csrfmiddlewaretoken": csrf_token,
+                "username": f"baduser{i}",
+                "password": "wrongpassword",
+            },
+        )
+        status = response.status
+        if status == 429:
+            break
+
+    assert status == 429, "Login was not rate limited after 31 attempts"
+
+
+def test_security_headers_present(anonymous_page: Page):
     """Verify critical security headers are present."""
-    response = page.goto("http://127.0.0.1:8000/accounts/login/")
+    response = anonymous_page.goto(LOGIN_PATH)
 
     headers = response.headers
 
@@ -1,16 +1,21 @@
 from __future__ import annotations
 
 from apps.babies.models import Baby
+from apps.common.security import rate_limit
 from apps.families.models import Family, FamilyMembership
 from django.contrib.auth import get_user_model
-from django.test import Client, TestCase
+from django.http import HttpResponse
+from django.test import Client, RequestFactory, SimpleTestCase, TestCase
 from django.urls import reverse
 
 
 class NavigationStabilityTests(TestCase):
-    def setUp(self):
+    @classmethod
+    def setUpTestData(cls):
         User = get_user_model()
-        self.user = User.objects.create_user("stable", "stable@example.com", "pass1234")
+        cls.user = User.objects.create_user("stable", "stable@example.com", "pass1234")
+
+    def setUp(self):
         self.client = Client()
         self.client.login(username="stable", password="pass1234")
 
@@ -37,21 +42,24 @@ class NavigationStabilityTests(TestCase):
 
 
 class EventValidationTests(TestCase):
-    def setUp(self):
+    @classmethod
+    def setUpTestData(cls):
         User = get_user_model()
-        self.user = User.objects.create_user("eventstable", "eventstable@example.com", "pass1234")
-        self.family = Family.objects.create(name="Stable Family", created_by=self.user)
+        cls.user = User.objects.create_user("eventstable", "eventstable@example.com", "pass1234")
+        cls.family = Family.objects.create(name="Stable Family", created_by=cls.user)
         FamilyMembership.objects.create(
-            family=self.family,
-            user=self.user,
+            family=cls.family,
+            user=cls.user,
             role=FamilyMembership.Role.OWNER,
         )
-        self.baby = Baby.objects.create(
-            family=self.family,
+        cls.baby = Baby.objects.create(
+            family=cls.family,
             name="Stable Baby",
             timezone="UTC",
-            created_by=self.user,
+            created_by=cls.user,
         )
+
+    def setUp(self):
         self.client = Client()
         self.client.login(username="eventstable", password="pass1234")
 
@@ -94,21 +102,24 @@ class EventValidationTests(TestCase):
         )
         self.assertEqual(create_response.status_code, 200)
 
-        event = self.baby.events.order_by("-created_at").first()
-        self.assertIsNotNone(event)
+        event_id = self.baby.events.order_by("-created_at").values_list("id", flat=True).first()
+        self.assertIsNotNone(event_id)
 
-        response = self.client.get(reverse("event_edit", kwargs={"event_id": event.id}))
+        response = self.client.get(reverse("event_edit", kwargs={"event_id": event_id}))
         self.assertEqual(response.status_code, 200)
         self.assertContains(
             response,
-            f'action="{reverse("event_update", kwargs={"event_id": event.id})}"',
+            f'action="{reverse("event_update", kwargs={"event_id": event_id})}"',
         )
 
 
 class NavigationVisibilityTests(TestCase):
-    def setUp(self):
+    @classmethod
+    def setUpTestData(cls):
         User = get_user_model()
-        self.user = User.objects.create_user("nav", "nav@example.com", "pass1234")
+        cls.user = User.objects.create_user("nav", "nav@example.com", "pass1234")
+
+    def setUp(self):
         self.client = Client()
         self.client.login(username="nav", password="pass1234")
 
@@ -142,3 +153,37 @@ class NavigationVisibilityTests(TestCase):
         with_baby = self.client.get(reverse("dashboard"))
         self.assertContains(with_baby, 'href="/timeline"')
         self.assertContains(with_baby, 'href="/calendar"')
+
+
+class PwaAssetTests(SimpleTestCase):
+    def test_service_worker_supports_conditional_get(self):
+        response = self.client.get(reverse("service_worker"))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["Cache-Control"], "no-cache")
+        self.assertIn("ETag", response)
+
+        cached = self.client.get(reverse("service_worker"), HTTP_IF_NONE_MATCH=response["ETag"])
+        self.assertEqual(cached.status_code, 304)
+
+    def test_manifest_supports_conditional_get(self):
+        response = self.client.get(reverse("manifest"))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["short_name"], "BabyBuddy")
+
+        cached = self.client.get(reverse("manifest"), HTTP_IF_NONE_MATCH=response["ETag"])
+        self.assertEqual(cached.status_code, 304)
+
+
+class RateLimitTests(SimpleTestCase):
+    def test_per_method_limits_use_separate_counters(self):
+        @rate_limit(limits={"GET": (2, 60), "POST": (1, 60)}, key_func=lambda request: "per-method")
+        def view(request):
+            return HttpResponse("ok")
+
+        factory = RequestFactory()
+        self.assertEqual(view(factory.post("/")).status_code, 200)
+        self.assertEqual(view(factory.post("/")).status_code, 429)
+        self.assertEqual(view(factory.get("/")).status_code, 200)
+        self.assertEqual(view(factory.get("/")).status_code, 200)
+        self.assertEqual(view(factory.get("/")).status_code, 429)
+        self.assertEqual(view(factory.put("/")).status_code, 200)